@@ -0,0 +1,214 @@
+"""Per-domain crawl rate governor shared by the article scraper and the powerlist populator
+
+scrape_articles.py paces its requests-based transport through CrawlGovernor.acquire();
+the asyncio populator uses acquire_async() and allowed_async(). Both report finished
+requests through observe(), so a domain's delay adapts the same way for either caller.
+"""
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+# Per-domain delay between requests, adapted to latency and errors
+DEFAULT_INITIAL_DELAY = 1.0
+DEFAULT_MIN_DELAY = 0.25
+DEFAULT_MAX_DELAY = 60.0
+DEFAULT_LATENCY_TARGET = 2.0
+ROBOTS_USER_AGENT = 'Mozilla/5.0'
+
+
+class RobotsDisallowed(Exception):
+    """Raised when robots.txt forbids fetching a URL"""
+
+
+def parse_retry_after(value):
+    """Retry-After header as seconds (delta-seconds or HTTP-date), or None"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+class DomainState:
+    def __init__(self, delay):
+        self.delay = delay
+        self.floor = None
+        self.next_allowed = 0.0
+        self.latency = None  # exponentially weighted moving average
+        self.robots = None
+        self.robots_lock = threading.Lock()
+        self.robots_task = None  # in-flight robots.txt load of async callers
+        self.requests = 0
+        self.backoffs = 0
+        self.waited = 0.0
+
+
+class CrawlGovernor:
+    """Per-domain crawl rate governor honoring robots.txt, Crawl-delay and Retry-After
+
+    Requests to a domain are spaced by a delay that shrinks while the host
+    answers quickly and grows when latency rises above the target or the host
+    returns 5xx/429. Retry-After pushes the next slot out explicitly. Slots
+    are reserved under a lock, so threads sharing a governor are spaced
+    correctly, and so are the asyncio tasks of one event loop.
+
+    fetch_robots(url) returns a requests-style response; fetch_robots_async(url)
+    is a coroutine returning (status, text). Whichever the caller uses loads
+    each domain's robots.txt once.
+    """
+
+    def __init__(self, fetch_robots=None, fetch_robots_async=None, initial_delay=DEFAULT_INITIAL_DELAY,
+                 min_delay=DEFAULT_MIN_DELAY, max_delay=DEFAULT_MAX_DELAY, latency_target=DEFAULT_LATENCY_TARGET,
+                 stats=None, user_agent=ROBOTS_USER_AGENT):
+        self.fetch_robots = fetch_robots
+        self.fetch_robots_async = fetch_robots_async
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.latency_target = latency_target
+        self.stats = stats
+        self.user_agent = user_agent
+        self.domains = {}
+        self.lock = threading.Lock()
+
+    def domain(self, url):
+        host = urlparse(url).netloc
+        with self.lock:
+            state = self.domains.get(host)
+            if state is None:
+                state = self.domains[host] = DomainState(self.initial_delay)
+        return host, state
+
+    def install_robots(self, state, status, text):
+        """Parse a fetched robots.txt (status None if it could not be fetched) into the domain state"""
+        rules = RobotFileParser()
+        if status is None or status >= 400:
+            # Missing or unreachable robots.txt: assume allowed, as crawlers conventionally do
+            rules.allow_all = True
+        else:
+            rules.parse(text.splitlines())
+
+        crawl_delay = rules.crawl_delay(self.user_agent) if not rules.allow_all else None
+        with self.lock:
+            state.floor = max(self.min_delay, float(crawl_delay or 0))
+            state.delay = max(state.delay, state.floor)
+        state.robots = rules
+
+    def robots_for(self, url):
+        """Load (once per domain) and return the domain's robots.txt rules"""
+        host, state = self.domain(url)
+        if state.robots is not None or self.fetch_robots is None:
+            return state.robots
+
+        with state.robots_lock:
+            if state.robots is None:
+                parts = urlparse(url)
+                try:
+                    response = self.fetch_robots(f"{parts.scheme}://{host}/robots.txt")
+                    status, text = response.status_code, response.text
+                except Exception:
+                    status, text = None, ''
+                self.install_robots(state, status, text)
+        return state.robots
+
+    async def robots_for_async(self, url):
+        """asyncio counterpart of robots_for(); concurrent tasks share one robots.txt load"""
+        host, state = self.domain(url)
+        if state.robots is not None or self.fetch_robots_async is None:
+            return state.robots
+
+        if state.robots_task is None:
+            async def load():
+                parts = urlparse(url)
+                try:
+                    status, text = await self.fetch_robots_async(f"{parts.scheme}://{host}/robots.txt")
+                except Exception:
+                    status, text = None, ''
+                self.install_robots(state, status, text)
+
+            state.robots_task = asyncio.ensure_future(load())
+        await asyncio.shield(state.robots_task)
+        return state.robots
+
+    def allowed(self, url):
+        if urlparse(url).path == '/robots.txt':
+            return True
+        rules = self.robots_for(url)
+        return rules is None or rules.can_fetch(self.user_agent, url)
+
+    async def allowed_async(self, url):
+        if urlparse(url).path == '/robots.txt':
+            return True
+        rules = await self.robots_for_async(url)
+        return rules is None or rules.can_fetch(self.user_agent, url)
+
+    def reserve_slot(self, url):
+        """Reserve the domain's next request slot; returns seconds to wait for it"""
+        host, state = self.domain(url)
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, state.next_allowed)
+            state.next_allowed = slot + state.delay
+            state.requests += 1
+            state.waited += slot - now
+        return slot - now
+
+    def reserve(self, url):
+        """reserve_slot() once the domain's robots.txt (and so its Crawl-delay) is known"""
+        if urlparse(url).path != '/robots.txt':
+            self.robots_for(url)
+        return self.reserve_slot(url)
+
+    def acquire(self, url):
+        wait_for = self.reserve(url)
+        if wait_for > 0:
+            if self.stats:
+                with self.stats.stage(self.stats.publication_for(url), 'sleep'):
+                    time.sleep(wait_for)
+            else:
+                time.sleep(wait_for)
+
+    async def acquire_async(self, url):
+        """asyncio counterpart of acquire(): waits for the domain's next slot without blocking the loop"""
+        if urlparse(url).path != '/robots.txt':
+            await self.robots_for_async(url)
+        wait_for = self.reserve_slot(url)
+        if wait_for > 0:
+            if self.stats:
+                with self.stats.stage(self.stats.publication_for(url), 'sleep'):
+                    await asyncio.sleep(wait_for)
+            else:
+                await asyncio.sleep(wait_for)
+
+    def observe(self, url, status=None, latency=None, retry_after=None):
+        """Adapt the domain delay to a finished request; status None means a connection error"""
+        host, state = self.domain(url)
+        floor = state.floor if state.floor is not None else self.min_delay
+        with self.lock:
+            if latency is not None:
+                state.latency = latency if state.latency is None else 0.8 * state.latency + 0.2 * latency
+
+            if status in (429, 503) or retry_after:
+                state.backoffs += 1
+                state.delay = min(self.max_delay, max(state.delay * 2, retry_after or 0))
+                if retry_after:
+                    state.next_allowed = max(state.next_allowed, time.monotonic() + retry_after)
+            elif status is None or status >= 500:
+                state.backoffs += 1
+                state.delay = min(self.max_delay, state.delay * 2)
+            elif state.latency is not None and state.latency > self.latency_target:
+                state.delay = min(self.max_delay, state.delay * 1.5)
+            else:
+                state.delay = max(floor, state.delay * 0.9)
+
+    def summary(self):
+        return {host: {'requests': st.requests, 'delay': st.delay, 'backoffs': st.backoffs,
+                       'latency': st.latency, 'waited': st.waited}
+                for host, st in self.domains.items()}
@@ -0,0 +1,27 @@
+-- Migration: Create scraped_articles table for the news scraper's database sink
+-- Created: 2026-10-19
+
+CREATE TABLE IF NOT EXISTS scraped_articles (
+    id SERIAL PRIMARY KEY,
+    canonical_url TEXT NOT NULL UNIQUE,
+    link TEXT NOT NULL,
+    title TEXT,
+    publication VARCHAR(255),
+    publication_logo TEXT,
+    publish_date VARCHAR(50),
+    category VARCHAR(100),
+    excerpt TEXT,
+    image TEXT,
+    read_time VARCHAR(50),
+    author VARCHAR(255),
+    body TEXT,
+    metrics JSONB,
+    content_hash VARCHAR(64) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create indexes for better performance
+CREATE INDEX IF NOT EXISTS idx_scraped_articles_publication ON scraped_articles(publication);
+CREATE INDEX IF NOT EXISTS idx_scraped_articles_publish_date ON scraped_articles(publish_date);
+CREATE INDEX IF NOT EXISTS idx_scraped_articles_updated_at ON scraped_articles(updated_at);
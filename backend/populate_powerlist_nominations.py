@@ -1,16 +1,175 @@
+import argparse
 import asyncio
+import base64
 import aiohttp
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+from bs4 import BeautifulSoup, UnicodeDammit
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 import json
+import math
 import os
+import shutil
+import tempfile
 from urllib.parse import urljoin, urlparse
 from PIL import Image
-import io
 import time
 from datetime import datetime
 import re
 
+# Per-domain pacing, robots.txt and Retry-After handling shared with scrape_articles.py
+from crawl_governor import CrawlGovernor, RobotsDisallowed, parse_retry_after
+
+# Shared headless Chromium: browsers per run, concurrent pages per browser, pages before a browser is relaunched
+DEFAULT_BROWSER_POOL_SIZE = 2
+DEFAULT_CONTEXTS_PER_BROWSER = 4
+DEFAULT_BROWSER_RECYCLE_AFTER = 50
+
+BROWSER_LAUNCH_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-accelerated-2d-canvas',
+    '--no-first-run',
+    '--no-zygote',
+    '--disable-gpu'
+]
+
+# Fast-render mode: the extractors only read the DOM, so images, fonts, media, stylesheets and
+# trackers are never fetched, and a page is ready once the content the extractors look for is there
+BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font', 'stylesheet', 'texttrack', 'eventsource', 'websocket', 'manifest', 'other'}
+BLOCKED_DOMAINS = (
+    'google-analytics.com',
+    'googletagmanager.com',
+    'googlesyndication.com',
+    'googleadservices.com',
+    'doubleclick.net',
+    'adservice.google.com',
+    'facebook.net',
+    'connect.facebook.com',
+    'scorecardresearch.com',
+    'quantserve.com',
+    'hotjar.com',
+    'segment.com',
+    'segment.io',
+    'mixpanel.com',
+    'newrelic.com',
+    'nr-data.net',
+    'chartbeat.com',
+    'chartbeat.net',
+    'taboola.com',
+    'outbrain.com',
+    'criteo.com',
+    'criteo.net',
+    'amazon-adsystem.com',
+    'adnxs.com',
+    'rubiconproject.com',
+    'pubmatic.com',
+    'moatads.com',
+    'optimizely.com',
+    'clarity.ms',
+    'bat.bing.com',
+    'snap.licdn.com',
+    'ads-twitter.com',
+    'tiktok.com',
+    'onetrust.com',
+    'cookielaw.org',
+    'youtube.com',
+    'vimeo.com'
+)
+PAGE_LOAD_TIMEOUT = 30000
+# Body content only: client-rendered shells already carry their <head> metas before anything renders
+PAGE_READY_SELECTOR = 'h1, [class*="headline"], .page-title'
+PAGE_READY_TIMEOUT = 5000
+
+# One pooled HTTP session per run: connection limits, DNS cache, keep-alive and timeouts
+HTTP_CONNECTION_LIMIT = 50
+HTTP_CONNECTIONS_PER_HOST = 6
+HTTP_DNS_CACHE_SECONDS = 600
+HTTP_KEEPALIVE_SECONDS = 30
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=20, connect=8)
+PROBE_TIMEOUT = aiohttp.ClientTimeout(total=8)
+DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=20)
+
+# Images are validated while they download: one streamed GET per candidate, aborted as soon as the
+# first bytes are not an image signature or the body outgrows the size limit
+MIN_IMAGE_BYTES = 2000
+MAX_IMAGE_BYTES = 10000000
+IMAGE_CHUNK_BYTES = 64 * 1024
+IMAGE_SNIFF_BYTES = 512
+
+# Every page and image request goes through the crawl governor. Guessed logo URLs are many small
+# requests to one host, so pacing starts from a shorter delay than the article scraper's; it still
+# backs off on slow answers, 5xx and 429, and never goes below a robots.txt Crawl-delay
+GOVERNOR_INITIAL_DELAY = 0.25
+GOVERNOR_MIN_DELAY = 0.1
+GOVERNOR_RETRIES = 1
+
+# Guessed logo URLs are probed concurrently, a few at a time per domain, for at most this long
+PROBES_PER_DOMAIN = 6
+LOGO_SEARCH_DEADLINE = 10
+
+# Image URL probe results are kept across runs: good results for a week, dead URLs for a day,
+# network errors (which may be transient) for an hour
+PROBE_CACHE_FILE = 'image-probe-cache.json'
+PROBE_CACHE_VALID_TTL = 7 * 24 * 3600
+PROBE_CACHE_INVALID_TTL = 24 * 3600
+PROBE_CACHE_ERROR_TTL = 3600
+
+# Pages are fetched over plain HTTP first; a domain that needed the browser goes straight to it
+# on later runs until the remembered tier expires and plain HTTP is given another try
+FETCH_TIER_FILE = 'fetch-tiers.json'
+FETCH_TIER_TTL = 14 * 24 * 3600
+MAX_HTML_BYTES = 5 * 1024 * 1024
+CLIENT_RENDERED_MARKERS = (
+    '<div id="root"></div>',
+    '<div id="app"></div>',
+    '<div id="__next"></div>',
+    '<app-root></app-root>',
+    'enable javascript',
+    'requires javascript'
+)
+
+HTML_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
+}
+
+# Downloaded images are decoded, resized and written in worker processes so the event loop never
+# blocks on them. 'responsive' writes every width as WebP plus a JPEG fallback from one decode;
+# 'legacy' writes a single 400x300 thumbnail in the source format. The nomination's image is the
+# WebP at PRIMARY_IMAGE_WIDTH (or the nearest smaller one); other variants go in image_variants.
+IMAGE_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+IMAGE_PROFILES = {
+    'responsive': {'widths': [160, 400, 800], 'formats': ['webp', 'jpeg']},
+    'legacy': {'widths': [400], 'formats': []}
+}
+DEFAULT_IMAGE_PROFILE = 'responsive'
+PRIMARY_IMAGE_WIDTH = 400
+WEBP_QUALITY = 80
+JPEG_QUALITY = 82
+
+# Stored images are named by the sha256 of the downloaded bytes and recorded in an index under
+# data/, with the populator's other local state. A new image reuses a stored asset only if its 64-bit difference hash is within
+# PHASH_MAX_DISTANCE bits, its aspect ratio is similar, and its alpha-aware 32x32 thumbnail is
+# within THUMB_MAX_RMS of the stored one; logos are too low-detail for the hash alone, and
+# near-flat images (hash all zeros or all ones, e.g. white-on-transparent) are never merged
+IMAGE_INDEX_FILE = 'image-index.json'
+PHASH_MAX_DISTANCE = 6
+PHASH_MAX_ASPECT_DIFFERENCE = 0.05
+THUMB_SIZE = 32
+THUMB_MAX_RMS = 10.0
+FLAT_PHASHES = (0, (1 << 64) - 1)
+
+# aiohttp only decodes brotli when the optional Brotli package is installed, so it is never offered
+HTTP_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate',
+    'Referer': 'https://www.google.com/'
+}
+
 # Enhanced power list sources - 35+ nominations
 power_list_sources = [
     {
@@ -423,15 +582,458 @@ power_list_sources = [
     }
 ]
 
+def sniff_image_type(head):
+    """File extension of the image format that head (a file's first bytes) starts with, or None"""
+    if head.startswith(b'\x89PNG'):
+        return '.png'
+    elif head.startswith(b'GIF8'):
+        return '.gif'
+    elif head.startswith(b'\xff\xd8\xff'):
+        return '.jpg'
+    elif head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return '.webp'
+    elif head[4:12] in (b'ftypavif', b'ftypavis'):
+        return '.avif'
+    text = head.lstrip()[:1024].lower()
+    if text.startswith((b'<?xml', b'<svg', b'<!--')) and b'<svg' in text and b'<html' not in text:
+        return '.svg'
+    return None
+
+
+def image_extension(head):
+    return sniff_image_type(head) or '.jpg'
+
+
+def flatten_for_jpeg(img):
+    """RGB copy of img with any transparency composited onto white"""
+    if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info):
+        rgba = img.convert('RGBA')
+        background = Image.new('RGB', rgba.size, (255, 255, 255))
+        background.paste(rgba, mask=rgba.split()[-1])
+        return background
+    return img.convert('RGB')
+
+
+def difference_hash(img):
+    """64-bit dHash of img: brightness gradients of a 9x8 greyscale thumbnail"""
+    small = flatten_for_jpeg(img).convert('L').resize((9, 8), Image.Resampling.LANCZOS)
+    pixels = list(small.getdata())
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            value = (value << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+    return value
+
+
+def thumbnail_signature(img):
+    """32x32 RGBA thumbnail of img with colour premultiplied by alpha, as raw bytes"""
+    small = img.convert('RGBA').resize((THUMB_SIZE, THUMB_SIZE), Image.Resampling.LANCZOS)
+    signature = bytearray()
+    for r, g, b, a in small.getdata():
+        signature += bytes((r * a // 255, g * a // 255, b * a // 255, a))
+    return bytes(signature)
+
+
+def thumbnail_rms(first, second):
+    """Root mean square difference between two thumbnail signatures"""
+    return math.sqrt(sum((x - y) ** 2 for x, y in zip(first, second)) / len(first))
+
+
+def find_near_duplicate(phash, aspect, thumb, known_images):
+    """Digest of the stored image that is pixel-for-pixel closest to this one, or None"""
+    if phash in FLAT_PHASHES:
+        return None
+
+    best = None
+    for digest, known_phash, known_aspect, known_thumb in known_images:
+        if known_phash in FLAT_PHASHES or len(known_thumb) != len(thumb):
+            continue
+        if abs(aspect - known_aspect) > PHASH_MAX_ASPECT_DIFFERENCE * max(aspect, known_aspect):
+            continue
+        if bin(phash ^ known_phash).count('1') > PHASH_MAX_DISTANCE:
+            continue
+        # The hash only shortlists; the thumbnails must actually match
+        rms = thumbnail_rms(thumb, known_thumb)
+        if rms <= THUMB_MAX_RMS and (best is None or rms < best[0]):
+            best = (rms, digest)
+    return best[1] if best else None
+
+
+def image_worker_ready():
+    """No-op task used to make the image pool fork its workers up front"""
+    return os.getpid()
+
+
+def process_image(source_path, uploads_dir, stem, profile, known_images=()):
+    """Decode the downloaded file once and write every size and format the profile asks for
+
+    Runs in the image process pool. known_images is a list of (digest, phash, aspect, thumb) of
+    stored images; if the decoded image is a near-duplicate of one, nothing is written. Returns
+    {'phash', 'aspect', 'thumb', 'duplicate_of', 'variants'} where variants is
+    {width: {format: filename}}; undecodable images (e.g. SVG) are written unchanged under
+    width 0 and have no phash.
+    """
+    settings = IMAGE_PROFILES[profile]
+    with open(source_path, 'rb') as f:
+        extension = image_extension(f.read(1024))
+    result = {'phash': None, 'aspect': None, 'thumb': None, 'duplicate_of': None, 'variants': {}}
+
+    try:
+        img = Image.open(source_path)
+        img.load()
+    except Exception:
+        filename = f"{stem}{extension}"
+        os.makedirs(uploads_dir, exist_ok=True)
+        shutil.copyfile(source_path, os.path.join(uploads_dir, filename))
+        result['variants'] = {0: {'original': filename}}
+        return result
+
+    result['phash'] = difference_hash(img)
+    result['aspect'] = img.width / max(1, img.height)
+    result['thumb'] = thumbnail_signature(img)
+    result['duplicate_of'] = find_near_duplicate(result['phash'], result['aspect'], result['thumb'], known_images)
+    if result['duplicate_of']:
+        return result
+
+    os.makedirs(uploads_dir, exist_ok=True)
+    if not settings['formats']:
+        # Single thumbnail in the source format
+        filename = f"{stem}{extension}"
+        try:
+            img.thumbnail((400, 300), Image.Resampling.LANCZOS)
+            img.save(os.path.join(uploads_dir, filename), quality=85, optimize=True)
+        except Exception:
+            shutil.copyfile(source_path, os.path.join(uploads_dir, filename))
+        result['variants'] = {img.width: {'original': filename}}
+        return result
+
+    if img.mode not in ('RGB', 'RGBA'):
+        img = img.convert('RGBA' if img.mode in ('LA', 'P', 'PA') else 'RGB')
+
+    variants = {}
+    # Largest first, each resized from the previous one; widths beyond the source are not upscaled
+    resized = img
+    for width in sorted(settings['widths'], reverse=True):
+        target = min(width, img.width)
+        if target in variants:
+            continue
+        if resized.width > target:
+            height = max(1, round(resized.height * target / resized.width))
+            resized = resized.resize((target, height), Image.Resampling.LANCZOS)
+
+        files = {}
+        for fmt in settings['formats']:
+            filename = f"{stem}-{target}w.{'jpg' if fmt == 'jpeg' else fmt}"
+            path = os.path.join(uploads_dir, filename)
+            if fmt == 'webp':
+                resized.save(path, 'WEBP', quality=WEBP_QUALITY, method=4)
+            else:
+                flatten_for_jpeg(resized).save(path, 'JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+            files[fmt] = filename
+        variants[target] = files
+
+    result['variants'] = variants
+    return result
+
+
+class ImageIndex:
+    """Stored images by content digest, per output profile; files live in uploads_dir, the index at path"""
+
+    def __init__(self, uploads_dir, path):
+        self.uploads_dir = uploads_dir
+        self.path = path
+        self.entries = {}
+        self.stats = {'stored': 0, 'exact': 0, 'similar': 0}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as error:
+                print(f"Ignoring unreadable image index {self.path}: {error}")
+
+    def get(self, profile, digest):
+        """The stored entry for digest if all of its files are still on disk, else None"""
+        entry = self.entries.get(profile, {}).get(digest)
+        if entry is None:
+            return None
+        if entry.get('alias_of'):
+            entry = self.entries[profile].get(entry['alias_of'])
+            if entry is None:
+                return None
+        for files in entry['variants'].values():
+            for name in files.values():
+                if not os.path.exists(os.path.join(self.uploads_dir, name)):
+                    return None
+        return entry
+
+    def known_images(self, profile):
+        return [(digest, int(entry['phash'], 16), entry['aspect'], base64.b64decode(entry['thumb']))
+                for digest, entry in self.entries.get(profile, {}).items()
+                if entry.get('phash') and entry.get('thumb') and not entry.get('alias_of')]
+
+    def put(self, profile, digest, phash, aspect, thumb, variants):
+        self.entries.setdefault(profile, {})[digest] = {
+            'phash': f"{phash:016x}" if phash is not None else None,
+            'aspect': aspect,
+            'thumb': base64.b64encode(thumb).decode('ascii') if thumb else None,
+            'variants': {str(width): files for width, files in variants.items()}
+        }
+
+    def alias(self, profile, digest, stored_digest):
+        self.entries.setdefault(profile, {})[digest] = {'alias_of': stored_digest}
+
+    def save(self):
+        if not self.entries:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with open(self.path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f)
+        os.replace(self.path + '.tmp', self.path)
+
+
+class BrowserPool:
+    """A few long-lived Chromium browsers shared by every page load in a run
+
+    Launching Chromium costs far more than opening a page, so browsers are
+    started lazily and reused. Each page gets its own browser context
+    (isolated cookies, cache and storage) that is closed after use. A
+    browser that crashed or disconnected is relaunched on the next request,
+    and a browser is also relaunched once it has served recycle_after pages
+    and is idle, to bound memory growth.
+    """
+
+    def __init__(self, size=DEFAULT_BROWSER_POOL_SIZE, contexts_per_browser=DEFAULT_CONTEXTS_PER_BROWSER,
+                 recycle_after=DEFAULT_BROWSER_RECYCLE_AFTER):
+        self.size = size
+        self.recycle_after = recycle_after
+        self.playwright = None
+        self.browsers = [None] * size
+        self.uses = [0] * size
+        self.active = [0] * size
+        self.slots = asyncio.Semaphore(size * contexts_per_browser)
+        self.lock = asyncio.Lock()
+        self.stats = {'launches': 0, 'restarts': 0, 'recycled': 0, 'pages': 0}
+
+    async def acquire_browser(self):
+        async with self.lock:
+            if self.playwright is None:
+                self.playwright = await async_playwright().start()
+
+            i = min(range(self.size), key=lambda i: self.active[i])
+            browser = self.browsers[i]
+            if browser is not None and not browser.is_connected():
+                print(f"Browser {i} disconnected, restarting it")
+                self.stats['restarts'] += 1
+                browser = None
+            elif browser is not None and self.uses[i] >= self.recycle_after and not self.active[i]:
+                self.stats['recycled'] += 1
+                with contextlib.suppress(Exception):
+                    await browser.close()
+                browser = None
+
+            if browser is None:
+                browser = await self.playwright.chromium.launch(headless=True, args=BROWSER_LAUNCH_ARGS)
+                self.browsers[i] = browser
+                self.uses[i] = 0
+                self.stats['launches'] += 1
+
+            self.uses[i] += 1
+            self.active[i] += 1
+            return i, browser
+
+    @contextlib.asynccontextmanager
+    async def page(self, **context_options):
+        """Open a page in a fresh context on a pooled browser; the context is closed on exit"""
+        async with self.slots:
+            i, browser = await self.acquire_browser()
+            context = None
+            try:
+                context = await browser.new_context(**context_options)
+                self.stats['pages'] += 1
+                yield await context.new_page()
+            finally:
+                self.active[i] -= 1
+                if context is not None:
+                    # Closing fails if the browser crashed; it is restarted on the next acquire
+                    with contextlib.suppress(Exception):
+                        await context.close()
+
+    async def close(self):
+        for browser in self.browsers:
+            if browser is not None:
+                with contextlib.suppress(Exception):
+                    await browser.close()
+        self.browsers = [None] * self.size
+        if self.playwright is not None:
+            await self.playwright.stop()
+            self.playwright = None
+
+
+class ProbeCache:
+    """Persistent cache of image URL checks: status, content type, size and validity"""
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self.stats = {'hits': 0, 'misses': 0, 'reused': 0}
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as error:
+                print(f"Ignoring unreadable probe cache {path}: {error}")
+
+    def get(self, url):
+        """The cached check for url if it is still fresh, else None"""
+        entry = self.entries.get(url)
+        if entry is not None:
+            if entry['valid']:
+                ttl = PROBE_CACHE_VALID_TTL
+            else:
+                ttl = PROBE_CACHE_INVALID_TTL if entry['status'] is not None else PROBE_CACHE_ERROR_TTL
+            if time.time() - entry['checked_at'] < ttl:
+                self.stats['hits'] += 1
+                return entry
+        self.stats['misses'] += 1
+        return None
+
+    def put(self, url, status, content_type, size, valid, digest=None):
+        self.entries[url] = {'status': status, 'content_type': content_type, 'size': size,
+                             'valid': valid, 'digest': digest, 'checked_at': time.time()}
+
+    def save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with open(self.path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f)
+        os.replace(self.path + '.tmp', self.path)
+
+
+class FetchTiers:
+    """Per-domain memory of which fetch tier ('http' or 'browser') produced a complete page"""
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self.stats = {'http': 0, 'browser': 0, 'escalated': 0}
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as error:
+                print(f"Ignoring unreadable fetch tier file {path}: {error}")
+
+    def get(self, domain):
+        """The remembered tier for domain if it is still fresh, else None"""
+        entry = self.entries.get(domain)
+        if entry is not None and time.time() - entry['checked_at'] < FETCH_TIER_TTL:
+            return entry['tier']
+        return None
+
+    def put(self, domain, tier):
+        self.stats[tier] += 1
+        # Keep the original timestamp when the tier is unchanged, so a remembered 'browser' still expires
+        if self.get(domain) != tier:
+            self.entries[domain] = {'tier': tier, 'checked_at': time.time()}
+
+    def save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with open(self.path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f)
+        os.replace(self.path + '.tmp', self.path)
+
+
 class PowerlistNominationPopulator:
-    def __init__(self):
+    def __init__(self, browser_pool_size=DEFAULT_BROWSER_POOL_SIZE, probe_cache_path=None, fast_render=True,
+                 fetch_tiers_path=None, image_profile=DEFAULT_IMAGE_PROFILE, image_index_path=None):
         self.processed_urls = set()
         self.max_retries = 3
         self.retry_delay = 5
         self.json_fallback_data = []
         self.semaphore = asyncio.Semaphore(5)  # Limit concurrent requests
+        self.browsers = BrowserPool(size=browser_pool_size)
+        self.fast_render = fast_render
+        self.render_stats = {'allowed': 0, 'blocked': 0}
+        self.session = None
+        self.http_requests = 0
+        self.domain_limits = {}
+        self.governor = CrawlGovernor(fetch_robots_async=self.fetch_robots, initial_delay=GOVERNOR_INITIAL_DELAY,
+                                      min_delay=GOVERNOR_MIN_DELAY)
+        self.probe_cache = ProbeCache(probe_cache_path or os.path.join(os.getcwd(), 'data', PROBE_CACHE_FILE))
+        self.fetch_tiers = FetchTiers(fetch_tiers_path or os.path.join(os.getcwd(), 'data', FETCH_TIER_FILE))
+        self.image_profile = image_profile
+        self.image_pool = None
+        self.image_variants = {}
+        self.image_index = ImageIndex(os.path.join(os.getcwd(), 'uploads', 'powerlist-nominations'),
+                                      image_index_path or os.path.join(os.getcwd(), 'data', IMAGE_INDEX_FILE))
+        self.image_stores = {}
+
+    def http(self):
+        """The run's shared aiohttp session, created on first use inside the event loop"""
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=HTTP_CONNECTION_LIMIT,
+                limit_per_host=HTTP_CONNECTIONS_PER_HOST,
+                ttl_dns_cache=HTTP_DNS_CACHE_SECONDS,
+                keepalive_timeout=HTTP_KEEPALIVE_SECONDS
+            )
+            self.session = aiohttp.ClientSession(connector=connector, headers=HTTP_HEADERS, timeout=HTTP_TIMEOUT)
+        self.http_requests += 1
+        return self.session
+
+    async def fetch_robots(self, url):
+        """robots.txt loader for the governor: (status, text)"""
+        async with self.http().get(url, headers=HTML_HEADERS, timeout=PROBE_TIMEOUT) as response:
+            body = await response.read()
+            return response.status, body.decode(response.charset or 'utf-8', errors='replace')
+
+    @contextlib.asynccontextmanager
+    async def governed_get(self, url, **kwargs):
+        """GET url on the pooled session, paced by the crawl governor and reported back to it
+
+        429 and 503 answers are retried once; the governor has already pushed
+        the domain's next slot past any Retry-After.
+        """
+        for attempt in range(GOVERNOR_RETRIES + 1):
+            await self.governor.acquire_async(url)
+            start = time.perf_counter()
+            try:
+                response = await self.http().get(url, **kwargs)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                self.governor.observe(url, None)
+                raise
+            self.governor.observe(url, response.status, time.perf_counter() - start,
+                                  parse_retry_after(response.headers.get('Retry-After')))
+
+            if response.status in (429, 503) and attempt < GOVERNOR_RETRIES:
+                response.release()
+                continue
+            try:
+                yield response
+            finally:
+                response.release()
+            return
+
+    def images(self):
+        """The run's image process pool, with its workers already forked
+
+        ProcessPoolExecutor only forks on the first submit, so no-op tasks are
+        run here. populate_nominations calls this before the HTTP session or
+        any resolver/executor thread exists, so workers never inherit a lock
+        held by one of them.
+        """
+        if self.image_pool is None:
+            self.image_pool = ProcessPoolExecutor(max_workers=IMAGE_WORKERS)
+            for future in [self.image_pool.submit(image_worker_ready) for _ in range(IMAGE_WORKERS)]:
+                future.result()
+        return self.image_pool
 
     async def populate_nominations(self):
+        # Fork the image workers while this process is still single-threaded
+        self.images()
         try:
             print(f"Starting powerlist nomination population for {len(power_list_sources)} sources...")
             print('All data will be saved to JSON file')
@@ -460,6 +1062,35 @@ class PowerlistNominationPopulator:
 
         except Exception as error:
             print(f'Fatal error in populateNominations: {error}')
+        finally:
+            if self.session is not None:
+                await self.session.close()
+            if self.image_pool is not None:
+                self.image_pool.shutdown()
+            self.image_index.save()
+            image_stats = self.image_index.stats
+            print(f"Images: {image_stats['stored']} stored, {image_stats['exact']} already stored, "
+                  f"{image_stats['similar']} matched a near-identical stored image")
+            self.probe_cache.save()
+            self.fetch_tiers.save()
+            tier_stats = self.fetch_tiers.stats
+            print(f"Pages: {tier_stats['http']} over plain HTTP, {tier_stats['browser']} in the browser "
+                  f"({tier_stats['escalated']} escalated after an incomplete HTTP fetch)")
+            print(f"HTTP: {self.http_requests} requests over one pooled session; "
+                  f"probe cache answered {self.probe_cache.stats['hits']} of "
+                  f"{self.probe_cache.stats['hits'] + self.probe_cache.stats['misses']} image checks, "
+                  f"{self.probe_cache.stats['reused']} without a download")
+            if self.fast_render:
+                print(f"Fast render: blocked {self.render_stats['blocked']} of "
+                      f"{self.render_stats['blocked'] + self.render_stats['allowed']} page requests")
+            domains = self.governor.summary().values()
+            print(f"Crawl governor: {sum(d['requests'] for d in domains)} requests over {len(domains)} domains, "
+                  f"{sum(d['waited'] for d in domains):.1f}s spent waiting for slots, "
+                  f"{sum(d['backoffs'] for d in domains)} backoffs")
+            stats = self.browsers.stats
+            await self.browsers.close()
+            print(f"Browser pool: {stats['pages']} pages on {stats['launches']} browser launches "
+                  f"({stats['restarts']} crash restarts, {stats['recycled']} recycled)")
 
     async def process_source(self, source):
         async with self.semaphore:
@@ -507,14 +1138,16 @@ class PowerlistNominationPopulator:
         power_list_name = source['power_list_name']
         description = self.generate_description(source)
 
-        # Always try to get an image first
+        # The page is loaded once, while the guessed logo URLs are probed; the logo search
+        # only waits for the page if none of the guesses is an image
+        print(f"Scraping {source['publication_name']}...")
+        page_task = asyncio.create_task(self.scrape_website_data(source['website_url']))
+
         print(f"Searching for logo/image for {source['publication_name']}...")
-        image_url = await self.find_best_image(source['website_url'], source['publication_name'])
+        image_url = await self.find_best_image(source['website_url'], source['publication_name'], page_task)
 
-        # Try to scrape for better data (optional)
         try:
-            print(f"Scraping enhanced data for {source['publication_name']}...")
-            scraped_data = await self.scrape_website_data(source['website_url'])
+            scraped_data = await page_task
 
             # Use scraped data if available and better than existing
             if scraped_data.get('title'):
@@ -537,6 +1170,7 @@ class PowerlistNominationPopulator:
             "location_region": source["location_region"],
             "last_power_list_url": source["last_power_list_url"],
             "image": image_url,  # This will now be a local path if image was successfully downloaded
+            "image_variants": self.image_variants.get(image_url, {}),
             "status": "approved",
             "is_active": True,
             "description": description,
@@ -565,71 +1199,139 @@ class PowerlistNominationPopulator:
                (f" Expected publication: {source['tentative_month']}." if source.get('tentative_month') else '')
 
     async def scrape_website_data(self, url):
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True, args=[
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-accelerated-2d-canvas',
-                '--no-first-run',
-                '--no-zygote',
-                '--disable-gpu'
-            ])
+        """Fetch the page once, over plain HTTP when that gives a complete page, else in the browser"""
+        if not await self.governor.allowed_async(url):
+            raise RobotsDisallowed(url)
+
+        domain = urlparse(url).netloc
+        if self.fetch_tiers.get(domain) != 'browser':
+            content = await self.fetch_html(url)
+            if content:
+                data = self.extract_page_data(content, url)
+                if not self.needs_browser(content, data):
+                    self.fetch_tiers.put(domain, 'http')
+                    return data
+                self.fetch_tiers.stats['escalated'] += 1
+                print(f"Static HTML of {url} is incomplete, rendering it in the browser")
+
+        content = await self.render_html(url)
+        self.fetch_tiers.put(domain, 'browser')
+        return self.extract_page_data(content, url)
+
+    async def fetch_html(self, url):
+        """The page HTML from a plain GET on the pooled session, or '' if it is not an HTML page"""
+        try:
+            async with self.governed_get(url, headers=HTML_HEADERS, allow_redirects=True) as response:
+                if response.status != 200 or 'html' not in response.headers.get('content-type', '').lower():
+                    return ''
+                body = bytearray()
+                async for chunk in response.content.iter_chunked(64 * 1024):
+                    body.extend(chunk)
+                    if len(body) >= MAX_HTML_BYTES:
+                        del body[MAX_HTML_BYTES:]
+                        break
+
+            # The header charset if there is one, else whatever the page's <meta> declares or the bytes suggest
+            dammit = UnicodeDammit(bytes(body), [response.charset] if response.charset else [], is_html=True)
+            return dammit.unicode_markup or ''
+        except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+            print(f"Plain fetch failed for {url}: {error}")
+            return ''
 
-            try:
-                context = await browser.new_context(
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    extra_http_headers={
-                        'Accept-Language': 'en-US,en;q=0.9',
-                        'Accept-Encoding': 'gzip, deflate, br',
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8'
-                    },
-                    viewport={'width': 1366, 'height': 768}
-                )
-                page = await context.new_page()
-
-                print(f"🔍 Scraping: {url}")
-                await page.goto(url, wait_until='networkidle', timeout=60000)
+    def needs_browser(self, content, data):
+        """Whether a plain-HTTP page is missing required fields or is rendered client-side"""
+        if not data['description'] or not (data['logo_candidates'] or data['image_candidates']):
+            return True
+        if data['title'] in ('', 'Power List'):
+            return True
+        lowered = content.lower()
+        return any(marker in lowered for marker in CLIENT_RENDERED_MARKERS)
+
+    async def render_html(self, url):
+        # One governor slot for the page load; the subresources it pulls in are not paced
+        await self.governor.acquire_async(url)
+        async with self.browsers.page(
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            extra_http_headers={
+                'Accept-Language': 'en-US,en;q=0.9',
+                'Accept-Encoding': 'gzip, deflate, br',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8'
+            },
+            viewport={'width': 1366, 'height': 768}
+        ) as page:
+            print(f"🔍 Scraping: {url}")
+            start = time.perf_counter()
+            if self.fast_render:
+                await page.route('**/*', self.route_request)
+                try:
+                    response = await page.goto(url, wait_until='domcontentloaded', timeout=PAGE_LOAD_TIMEOUT)
+                except Exception:
+                    self.governor.observe(url, None)
+                    raise
+                self.observe_page(url, response, start)
+
+                # Client-rendered pages fill in their headline after the DOM is ready; static pages
+                # already have it and do not wait at all
+                try:
+                    await page.wait_for_selector(PAGE_READY_SELECTOR, state='attached', timeout=PAGE_READY_TIMEOUT)
+                except PlaywrightTimeoutError:
+                    pass
+            else:
+                try:
+                    response = await page.goto(url, wait_until='networkidle', timeout=60000)
+                except Exception:
+                    self.governor.observe(url, None)
+                    raise
+                self.observe_page(url, response, start)
 
                 # Wait for content to load
                 await asyncio.sleep(3)
 
-                content = await page.content()
-                soup = BeautifulSoup(content, 'html.parser')
+            content = await page.content()
 
-                # Enhanced title extraction
-                title = self.extract_title(soup, url)
+        return content
 
-                # Enhanced image extraction
-                image = await self.extract_best_image(soup, url, page)
+    def observe_page(self, url, response, start):
+        """Report a browser page load to the crawl governor"""
+        if response is None:
+            return
+        self.governor.observe(url, response.status, time.perf_counter() - start,
+                              parse_retry_after(response.headers.get('retry-after')))
 
-                # Extract description
-                description = self.extract_description(soup)
+    def extract_page_data(self, content, url):
+        """Everything the nomination needs from one page's HTML"""
+        soup = BeautifulSoup(content, 'html.parser')
+        title = self.extract_title(soup, url)
+        description = self.extract_description(soup)
+        power_list_name = self.extract_power_list_name(soup, title)
+        logo_candidates = self.extract_logo_candidates(soup, url)
+        image_candidates = self.extract_image_candidates(soup, url)
 
-                # Extract power list specific information
-                power_list_name = self.extract_power_list_name(soup, title)
+        print(f"Extracted - Title: \"{title}\", Logos: {len(logo_candidates)}, Images: {len(image_candidates)}, Description: \"{'YES' if description else 'NO'}\"")
 
-                print(f"Extracted - Title: \"{title}\", Image: \"{'YES' if image else 'NO'}\", Description: \"{'YES' if description else 'NO'}\"")
-
-                # Download and save image if found
-                local_image_path = ''
-                if image:
-                    try:
-                        local_image_path = await self.download_and_save_image(image, title)
-                    except Exception as image_error:
-                        print(f"Image download failed for {title}: {image_error}")
-
-                return {
-                    "title": title or '',
-                    "powerListName": power_list_name or '',
-                    "image": local_image_path,
-                    "description": description or '',
-                    "logo": image or ''
-                }
+        return {
+            "title": title or '',
+            "powerListName": power_list_name or '',
+            "description": description or '',
+            "logo_candidates": logo_candidates,
+            "image_candidates": image_candidates
+        }
 
-            finally:
-                await context.close()
-                await browser.close()
+    async def route_request(self, route):
+        """Abort requests the extractors do not need: non-document resources and trackers"""
+        request = route.request
+        host = urlparse(request.url).hostname or ''
+        if request.is_navigation_request() and request.frame.parent_frame is None:
+            blocked = False
+        else:
+            blocked = request.resource_type in BLOCKED_RESOURCE_TYPES or \
+                any(host == domain or host.endswith('.' + domain) for domain in BLOCKED_DOMAINS)
+        if blocked:
+            self.render_stats['blocked'] += 1
+            await route.abort()
+        else:
+            self.render_stats['allowed'] += 1
+            await route.continue_()
 
     def extract_title(self, soup, url):
         title_selectors = [
@@ -661,7 +1363,8 @@ class PowerlistNominationPopulator:
 
         return title or 'Power List'
 
-    async def extract_best_image(self, soup, url, page):
+    def extract_image_candidates(self, soup, url):
+        """Page images (og/twitter meta, featured and header images), most preferred first"""
         image_selectors = [
             'meta[property="og:image"]',
             'meta[name="twitter:image"]',
@@ -687,32 +1390,49 @@ class PowerlistNominationPopulator:
             '.navigation img'
         ]
 
+        candidates = []
         for selector in image_selectors:
             element = soup.select_one(selector)
-            img_src = ''
+            if not element:
+                continue
 
             if selector.startswith('meta') or selector.startswith('link'):
                 img_src = element.get('content') or element.get('href')
             else:
                 img_src = element.get('src') or element.get('data-src') or element.get('data-lazy-src') or element.get('data-original')
 
-            if img_src:
-                img_src = urljoin(url, img_src)
-                if await self.is_valid_and_accessible_image(img_src):
-                    print(f"Found valid image: {img_src}")
-                    return img_src
+            if img_src and urljoin(url, img_src) not in candidates:
+                candidates.append(urljoin(url, img_src))
 
-        # If no image found, try to find any suitable image
-        all_images = soup.find_all('img')
-        for img in all_images:
+        # Any other image on the page, as a last resort
+        for img in soup.find_all('img'):
             img_src = img.get('src') or img.get('data-src')
-            if img_src:
-                img_src = urljoin(url, img_src)
-                if await self.is_valid_and_accessible_image(img_src):
-                    print(f"Found fallback image: {img_src}")
-                    return img_src
+            if img_src and urljoin(url, img_src) not in candidates:
+                candidates.append(urljoin(url, img_src))
 
-        return ''
+        return candidates
+
+    def extract_logo_candidates(self, soup, url):
+        """Images that look like the site logo, most preferred first"""
+        logo_selectors = [
+            'img[alt*="logo" i]',
+            'img[class*="logo" i]',
+            'img[src*="logo" i]',
+            '.site-logo img',
+            '.navbar-brand img',
+            '.header-logo img',
+            '.brand img',
+            'header img:first-child'
+        ]
+
+        candidates = []
+        for selector in logo_selectors:
+            img = soup.select_one(selector)
+            if img:
+                src = img.get('src') or img.get('data-src')
+                if src and urljoin(url, src) not in candidates:
+                    candidates.append(urljoin(url, src))
+        return candidates
 
     def normalize_image_url(self, img_src, base_url):
         if img_src.startswith('//'):
@@ -723,80 +1443,192 @@ class PowerlistNominationPopulator:
             return urljoin(base_url, img_src)
         return img_src
 
-    async def is_valid_and_accessible_image(self, url):
+    async def fetch_image(self, url):
+        """Validate and download url in one streamed GET
+
+        Returns {'path', 'digest', 'size'} for a temporary file holding the image, which the
+        caller must remove, or None if url is not a usable image. The body is rejected as soon
+        as its first bytes are not an image signature or it grows past MAX_IMAGE_BYTES.
+        A url whose fresh probe-cache digest is already stored is not fetched again; its
+        download has path None.
+        """
+        if url.startswith('data:') or url.startswith('blob:'):
+            return None
+
+        if 'favicon' in url or 'icon' in url or 'sprite' in url:
+            return None
+
+        cached = self.probe_cache.get(url)
+        if cached is not None and not cached['valid']:
+            return None
+        if cached is not None and cached.get('digest') and self.image_index.get(self.image_profile, cached['digest']):
+            self.probe_cache.stats['reused'] += 1
+            return {'path': None, 'digest': cached['digest'], 'size': cached['size']}
+
+        if not await self.governor.allowed_async(url):
+            return None
+
+        status, content_type, size, download = None, '', 0, None
+        fd, path = tempfile.mkstemp(prefix='powerlist-image-')
         try:
-            if url.startswith('data:') or url.startswith('blob:'):
-                return False
-
-            if 'favicon' in url or 'icon' in url or 'sprite' in url:
-                return False
-
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Referer': 'https://www.google.com/'
-            }
-
-            async with aiohttp.ClientSession(headers=headers) as session:
-                async with session.head(url, timeout=aiohttp.ClientTimeout(total=8)) as response:
+            with os.fdopen(fd, 'wb') as f:
+                async with self.governed_get(url, timeout=DOWNLOAD_TIMEOUT) as response:
+                    status = response.status
                     content_type = response.headers.get('content-type', '')
-                    content_length = int(response.headers.get('content-length', '0'))
+                    declared = int(response.headers.get('content-length') or 0)
+                    if status == 200 and declared <= MAX_IMAGE_BYTES:
+                        digest = hashlib.sha256()
+                        head = b''
+                        async for chunk in response.content.iter_chunked(IMAGE_CHUNK_BYTES):
+                            size += len(chunk)
+                            if size > MAX_IMAGE_BYTES:
+                                break
+                            if head is not None:
+                                head += chunk
+                                if len(head) < IMAGE_SNIFF_BYTES:
+                                    continue
+                                if not sniff_image_type(head):
+                                    break
+                                chunk, head = head, None
+                            digest.update(chunk)
+                            f.write(chunk)
+                        else:
+                            # Bodies shorter than the sniff window are still buffered in head
+                            if head is not None and sniff_image_type(head):
+                                digest.update(head)
+                                f.write(head)
+                                head = None
+                            if head is None and size >= MIN_IMAGE_BYTES:
+                                download = {'path': path, 'digest': digest.hexdigest(), 'size': size}
+                    else:
+                        size = declared
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, OSError):
+            pass
+        finally:
+            if download is None:
+                with contextlib.suppress(OSError):
+                    os.remove(path)
+
+        self.probe_cache.put(url, status, content_type, size, download is not None,
+                             download['digest'] if download else None)
+        return download
+
+    async def first_valid_image(self, urls, deadline=LOGO_SEARCH_DEADLINE):
+        """Fetch urls concurrently and return (url, download) for the most preferred (earliest) valid image
+
+        Fetches run under a per-domain limit. As soon as every more preferred
+        url has failed and one succeeds, the remaining fetches are cancelled.
+        At the deadline the best url that has succeeded so far is returned.
+        (None, None) if no url is an image. The download's temporary file
+        belongs to the caller; those of the other urls are removed here.
+        """
+        async def probe(url):
+            domain = urlparse(url).netloc
+            limit = self.domain_limits.setdefault(domain, asyncio.Semaphore(PROBES_PER_DOMAIN))
+            async with limit:
+                return await self.fetch_image(url)
+
+        tasks = [asyncio.create_task(probe(url)) for url in urls]
+        loop = asyncio.get_running_loop()
+        end = loop.time() + deadline
+        winner = (None, None)
+        try:
+            for url, task in zip(urls, tasks):
+                done, _ = await asyncio.wait({task}, timeout=max(end - loop.time(), 0))
+                if not done:
+                    break
+                if task.result():
+                    winner = (url, task.result())
+                    return winner
+
+            for url, task in zip(urls, tasks):
+                if task.done() and task.result():
+                    winner = (url, task.result())
+                    return winner
+            return winner
+        finally:
+            for task in tasks:
+                task.cancel()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            for result in results:
+                if isinstance(result, dict) and result['path'] and result is not winner[1]:
+                    with contextlib.suppress(OSError):
+                        os.remove(result['path'])
+
+    def guess_logo_urls(self, website_url):
+        domain = urlparse(website_url).netloc
+        return [
+            f"https://{domain}/wp-content/uploads/logo.png",
+            f"https://{domain}/wp-content/uploads/logo.jpg",
+            f"https://{domain}/wp-content/uploads/logo.svg",
+            f"https://{domain}/wp-content/themes/{domain.split('.')[0]}/images/logo.png",
+            f"https://{domain}/wp-content/uploads/{datetime.now().year}/logo.png",
+            f"https://{domain}/images/logo.png",
+            f"https://{domain}/images/logo.jpg",
+            f"https://{domain}/images/logo.svg",
+            f"https://{domain}/assets/images/logo.png",
+            f"https://{domain}/assets/images/logo.jpg",
+            f"https://{domain}/assets/logo.png",
+            f"https://{domain}/static/images/logo.png",
+            f"https://{domain}/static/logo.png",
+            f"https://{domain}/media/logo.png",
+            f"https://{domain}/logo.png",
+            f"https://{domain}/logo.jpg",
+            f"https://{domain}/logo.svg",
+            f"https://{domain}/brand/logo.png",
+            f"https://{domain}/brand/images/logo.png",
+            f"https://{domain}/sites/default/files/logo.png",
+            f"https://{domain}/uploads/logo.png",
+            f"https://{domain}/apple-touch-icon.png",
+            f"https://{domain}/apple-touch-icon-180x180.png",
+            f"https://{domain}/favicon-32x32.png",
+            f"https://{domain}/favicon.png"
+        ]
+
+    async def download_first_valid(self, urls):
+        """Download the most preferred valid image among urls; returns its local path or ''"""
+        # If the winner fails to download, continue with the candidates after it
+        while urls:
+            image_url, download = await self.first_valid_image(urls)
+            if not image_url:
+                break
+            try:
+                local_path = await self.save_image_locally(download)
+                print(f"Successfully downloaded and saved: {local_path}")
+                return local_path
+            except Exception as error:
+                print(f"Image save failed for {image_url}: {error}")
+                urls = urls[urls.index(image_url) + 1:]
+            finally:
+                if download['path']:
+                    with contextlib.suppress(OSError):
+                        os.remove(download['path'])
+        return ''
 
-                    return content_type.startswith('image/') and content_length > 2000 and content_length < 10000000
-        except:
-            return False
+    async def find_best_image(self, website_url, publication_name, page_task=None):
+        """Guessed logo URLs first, then logos and other images from the scraped page
 
-    async def find_best_image(self, website_url, publication_name):
+        page_task is the in-flight scrape_website_data task for the same url; it
+        is only awaited if none of the guessed logo URLs is an image.
+        """
         try:
-            print(f"Searching for logo/image for {publication_name}...")
-            domain = urlparse(website_url).netloc
-
-            logo_urls = [
-                f"https://{domain}/wp-content/uploads/logo.png",
-                f"https://{domain}/wp-content/uploads/logo.jpg",
-                f"https://{domain}/wp-content/uploads/logo.svg",
-                f"https://{domain}/wp-content/themes/{domain.split('.')[0]}/images/logo.png",
-                f"https://{domain}/wp-content/uploads/{datetime.now().year}/logo.png",
-                f"https://{domain}/images/logo.png",
-                f"https://{domain}/images/logo.jpg",
-                f"https://{domain}/images/logo.svg",
-                f"https://{domain}/assets/images/logo.png",
-                f"https://{domain}/assets/images/logo.jpg",
-                f"https://{domain}/assets/logo.png",
-                f"https://{domain}/static/images/logo.png",
-                f"https://{domain}/static/logo.png",
-                f"https://{domain}/media/logo.png",
-                f"https://{domain}/logo.png",
-                f"https://{domain}/logo.jpg",
-                f"https://{domain}/logo.svg",
-                f"https://{domain}/brand/logo.png",
-                f"https://{domain}/brand/images/logo.png",
-                f"https://{domain}/sites/default/files/logo.png",
-                f"https://{domain}/uploads/logo.png",
-                f"https://{domain}/apple-touch-icon.png",
-                f"https://{domain}/apple-touch-icon-180x180.png",
-                f"https://{domain}/favicon-32x32.png",
-                f"https://{domain}/favicon.png"
-            ]
-
-            for logo_url in logo_urls:
+            local_path = await self.download_first_valid(self.guess_logo_urls(website_url))
+            if local_path:
+                print(f"Successfully found and saved logo for {publication_name}")
+                return local_path
+
+            if page_task is not None:
                 try:
-                    if await self.is_valid_and_accessible_image(logo_url):
-                        local_path = await self.download_and_save_image(logo_url, f"{publication_name}-logo")
-                        print(f"Successfully found and saved logo: {logo_url}")
+                    scraped_data = await asyncio.shield(page_task)
+                except Exception as error:
+                    print(f"Error scraping homepage logo for {publication_name}: {error}")
+                    scraped_data = {}
+
+                for key in ('logo_candidates', 'image_candidates'):
+                    local_path = await self.download_first_valid(scraped_data.get(key, []))
+                    if local_path:
+                        print(f"Found image on the page for {publication_name}")
                         return local_path
-                except:
-                    continue
-
-            # Try to scrape the homepage for logo images
-            try:
-                logo_from_homepage = await self.scrape_logo(website_url)
-                if logo_from_homepage:
-                    return logo_from_homepage
-            except Exception as error:
-                print(f"Error scraping homepage logo for {publication_name}: {error}")
 
             print(f"No logo found for {publication_name}")
             return ''
@@ -804,121 +1636,66 @@ class PowerlistNominationPopulator:
             print(f"Logo search failed for {publication_name}: {error}")
             return ''
 
-    async def scrape_logo(self, url):
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True, args=[
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-dev-shm-usage'
-            ])
-
-            try:
-                context = await browser.new_context(
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                )
-                page = await context.new_page()
-                await page.goto(url, wait_until='networkidle', timeout=30000)
-
-                content = await page.content()
-                soup = BeautifulSoup(content, 'html.parser')
-
-                logo_selectors = [
-                    'img[alt*="logo" i]',
-                    'img[class*="logo" i]',
-                    'img[src*="logo" i]',
-                    '.site-logo img',
-                    '.navbar-brand img',
-                    '.header-logo img',
-                    '.brand img',
-                    'header img:first-child'
-                ]
-
-                for selector in logo_selectors:
-                    img = soup.select_one(selector)
-                    if img:
-                        src = img.get('src') or img.get('data-src')
-                        if src:
-                            normalized_src = urljoin(url, src)
-                            if await self.is_valid_and_accessible_image(normalized_src):
-                                await browser.close()
-                                publication_name = urlparse(url).netloc.replace('.', '-')
-                                return await self.download_and_save_image(normalized_src, f"{publication_name}-scraped-logo")
-
-                await context.close()
-                await browser.close()
-                return ''
-            except Exception as error:
-                print(f'Error scraping logo from homepage: {error}')
-                return ''
-
-    async def download_and_save_image(self, image_url, filename):
+    async def save_image_locally(self, download):
+        """Store a fetch_image download and return its public URL"""
+        digest = download['digest']
         try:
-            print(f"Downloading image: {image_url}")
-
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Referer': 'https://www.google.com/'
+            # Concurrent saves of the same bytes share one store operation
+            store = self.image_stores.get(digest)
+            if store is None:
+                store = asyncio.ensure_future(self.store_image(download['path'], digest))
+                self.image_stores[digest] = store
+            entry = await asyncio.shield(store)
+
+            public_variants = {
+                int(width): {fmt: f"/uploads/powerlist-nominations/{name}" for fmt, name in files.items()}
+                for width, files in entry['variants'].items()
             }
+            smaller = [width for width in public_variants if width <= PRIMARY_IMAGE_WIDTH]
+            primary = public_variants[max(smaller) if smaller else min(public_variants)]
+            public_url = primary.get('webp') or primary.get('original')
+            if 'webp' in primary:
+                self.image_variants[public_url] = {str(width): files for width, files in sorted(public_variants.items())}
 
-            async with aiohttp.ClientSession(headers=headers) as session:
-                async with session.get(image_url, timeout=aiohttp.ClientTimeout(total=20)) as response:
-                    if response.status == 200:
-                        image_data = await response.read()
-                        if len(image_data) > 2000:
-                            local_path = await self.save_image_locally(image_data, filename)
-                            print(f"Successfully downloaded and saved: {local_path}")
-                            return local_path
-
-                    raise Exception(f"Invalid image data: {len(image_data) if 'image_data' in locals() else 0} bytes")
-        except Exception as error:
-            print(f"Image download failed for {filename}: {error}")
-            raise error
-
-    async def save_image_locally(self, image_buffer, filename):
-        try:
-            uploads_dir = os.path.join(os.getcwd(), 'uploads', 'powerlist-nominations')
-            os.makedirs(uploads_dir, exist_ok=True)
-
-            timestamp = int(time.time() * 1000)
-            random_suffix = str(hash(filename))[:8]
-
-            # Detect image type
-            extension = '.jpg'
-            signature = image_buffer[:4].hex()
-            if signature.startswith('89504e47'):
-                extension = '.png'
-            elif signature.startswith('47494638'):
-                extension = '.gif'
-            elif signature.startswith('ffd8ffe') or signature.startswith('ffd8ffdb'):
-                extension = '.jpg'
-            elif signature.startswith('52494646'):
-                extension = '.webp'
-
-            base_name = re.sub(r'[^a-zA-Z0-9-]', '-', filename.lower())
-            unique_filename = f"{base_name}-{timestamp}-{random_suffix}{extension}"
-            filepath = os.path.join(uploads_dir, unique_filename)
-
-            # Optimize image
-            try:
-                img = Image.open(io.BytesIO(image_buffer))
-                img.thumbnail((400, 300), Image.Resampling.LANCZOS)
-                img.save(filepath, quality=85, optimize=True)
-            except Exception:
-                # Save original if optimization fails
-                with open(filepath, 'wb') as f:
-                    f.write(image_buffer)
-
-            public_url = f"/uploads/powerlist-nominations/{unique_filename}"
             print(f"Image saved locally: {public_url}")
 
             return public_url
         except Exception as error:
+            self.image_stores.pop(digest, None)
             print(f"Local image save error: {error}")
             raise Exception(f"Failed to save image locally: {error}")
 
+    async def store_image(self, image_path, digest):
+        """Index entry for the image with this digest, writing its files only if nothing like it is stored"""
+        profile = self.image_profile
+        entry = self.image_index.get(profile, digest)
+        if entry is not None:
+            self.image_index.stats['exact'] += 1
+            return entry
+        if image_path is None:
+            # A probe-cache reuse whose stored files disappeared since fetch_image checked them
+            raise FileNotFoundError(f"stored image {digest} is no longer on disk")
+
+        # Decoding, hashing, resizing and writing happen in the image pool; the loop only awaits the result
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self.images(), process_image, image_path,
+                                            self.image_index.uploads_dir, digest, profile,
+                                            self.image_index.known_images(profile))
+
+        if result['duplicate_of']:
+            entry = self.image_index.get(profile, result['duplicate_of'])
+            if entry is not None:
+                self.image_index.alias(profile, digest, result['duplicate_of'])
+                self.image_index.stats['similar'] += 1
+                return entry
+            # The matched files are gone; store this image after all
+            result = await loop.run_in_executor(self.images(), process_image, image_path,
+                                                self.image_index.uploads_dir, digest, profile)
+
+        self.image_index.put(profile, digest, result['phash'], result['aspect'], result['thumb'], result['variants'])
+        self.image_index.stats['stored'] += 1
+        return self.image_index.entries[profile][digest]
+
     async def save_nomination(self, nomination_data):
         try:
             self.json_fallback_data.append(nomination_data)
@@ -1062,8 +1839,28 @@ if __name__ == "__main__":
         return ''
 
 # Enhanced run section
+def parse_args():
+    parser = argparse.ArgumentParser(description='Populate powerlist nominations from publication websites')
+    parser.add_argument('--browsers', type=int, default=DEFAULT_BROWSER_POOL_SIZE,
+                        help=f'Headless browsers shared by all page loads (default: {DEFAULT_BROWSER_POOL_SIZE})')
+    parser.add_argument('--probe-cache', metavar='PATH',
+                        help=f'Image probe cache file (default: data/{PROBE_CACHE_FILE})')
+    parser.add_argument('--fetch-tiers', metavar='PATH',
+                        help=f'Per-domain fetch tier memory (default: data/{FETCH_TIER_FILE})')
+    parser.add_argument('--image-profile', choices=sorted(IMAGE_PROFILES), default=DEFAULT_IMAGE_PROFILE,
+                        help=f'Saved image sizes and formats (default: {DEFAULT_IMAGE_PROFILE})')
+    parser.add_argument('--image-index', metavar='PATH',
+                        help=f'Stored image index (default: data/{IMAGE_INDEX_FILE})')
+    parser.add_argument('--full-render', action='store_true',
+                        help='Load every page resource and wait for network idle instead of fast-render mode')
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    populator = PowerlistNominationPopulator()
+    args = parse_args()
+    populator = PowerlistNominationPopulator(browser_pool_size=args.browsers, probe_cache_path=args.probe_cache,
+                                             fast_render=not args.full_render, fetch_tiers_path=args.fetch_tiers,
+                                             image_profile=args.image_profile, image_index_path=args.image_index)
 
     print('Starting Enhanced Powerlist Nomination Populator...')
     print(f'Target: {len(power_list_sources)} powerlist nominations')
@@ -1,4 +1,3 @@
-
 #!/usr/bin/env python3
 """
 Article Scraper for Major Indian Publications
@@ -6,385 +5,2872 @@ Scrapes real articles from Times of India, Hindustan Times, Economic Times, etc.
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from bs4 import BeautifulSoup, SoupStrainer
+import argparse
+from array import array
+from bisect import bisect_left
+import glob
+import gzip
+import hashlib
+import itertools
+import heapq
+import io
+import math
+import mmap
 import json
+import os
+import queue
+import shutil
+import signal
+import socket
+import sqlite3
+import threading
+import zipfile
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
 import time
 import random
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, urlunparse, parse_qsl, urlencode
 import re
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+import xml.etree.ElementTree as ET
+
+# The crawl rate governor (delays, robots.txt, Retry-After) is shared with the powerlist populator
+from backend.crawl_governor import (CrawlGovernor, RobotsDisallowed, parse_retry_after, DEFAULT_INITIAL_DELAY,
+                                    DEFAULT_MIN_DELAY, DEFAULT_MAX_DELAY, ROBOTS_USER_AGENT)
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# psycopg2 is only needed for the PostgreSQL article sink
+try:
+    import psycopg2
+except ImportError:
+    psycopg2 = None
+
+# lxml is several times faster than the pure-python html.parser; fall back
+# to html.parser when it is not installed.
+try:
+    import lxml  # noqa: F401
+    DEFAULT_PARSER = 'lxml'
+except ImportError:
+    DEFAULT_PARSER = 'html.parser'
+
+# Per-publication scraping configuration
+PUBLICATIONS = {
+    'times_of_india': {
+        'name': 'The Times of India',
+        'short_name': 'TOI',
+        'base_url': 'https://timesofindia.indiatimes.com',
+        'section': '/business/india-business',
+        'pagination': '{section}/{page}',
+        'link_pattern': r'/articleshow/',
+        'category': 'Business',
+        'logo': 'https://static.toiimg.com/photo/47529300.cms',
+        'title_attrs': {'data-article-title': True},
+        'image_hint': 'photo',
+        'author': ('a', {'class': 'auth_detail'}),
+        'default_author': 'TOI Correspondent',
+        'body': ['div._s30J', 'div.Normal', 'div[data-articlebody]'],
+        'date': ('span', {'class': 'date'}),
+        'metrics': {'views': (50, 200), 'shares': (1, 5), 'engagement': (5, 12)},
+        'cache_ttl': 1800,
+        'feeds': ['https://timesofindia.indiatimes.com/rssfeeds/1898055.cms'],
+        'sitemaps': []
+    },
+    'hindustan_times': {
+        'name': 'Hindustan Times',
+        'short_name': 'HT',
+        'base_url': 'https://www.hindustantimes.com',
+        'section': '/india-news',
+        'pagination': '{section}/page-{page}',
+        'link_pattern': r'/india-news/',
+        'category': 'News',
+        'logo': 'https://www.hindustantimes.com/ht-img/img/2023/09/15/1600x900/HT_1694767296495_1694767296731.jpg',
+        'title_attrs': None,
+        'image_hint': 'ht-img',
+        'author': ('span', {'class': 'author-name'}),
+        'default_author': 'HT Correspondent',
+        'body': ['div.storyDetails', 'div.detail'],
+        'date': ('span', {'class': 'date-published'}),
+        'metrics': {'views': (30, 150), 'shares': (1, 4), 'engagement': (4, 10)},
+        'cache_ttl': 900,
+        'feeds': ['https://www.hindustantimes.com/feeds/rss/india-news/rssfeed.xml'],
+        'sitemaps': []
+    },
+    'economic_times': {
+        'name': 'Economic Times',
+        'short_name': 'ET',
+        'base_url': 'https://economictimes.indiatimes.com',
+        'section': '/markets',
+        'pagination': '{section}?page={page}',
+        'link_pattern': r'/articleshow/',
+        'category': 'Markets',
+        'logo': 'https://img.etimg.com/photo/msid-111111111,quality-100/et-logo.jpg',
+        'title_attrs': None,
+        'image_hint': 'etimg',
+        'author': ('span', {'class': 'ag'}),
+        'default_author': 'ET Bureau',
+        'body': ['div.artText', 'div.article_content'],
+        'date': ('time', {}),
+        'date_attr': 'datetime',
+        'metrics': {'views': (40, 180), 'shares': (1, 4), 'engagement': (5, 11)},
+        'cache_ttl': 600,
+        'feeds': ['https://economictimes.indiatimes.com/markets/rssfeeds/1977021501.cms'],
+        'sitemaps': []
+    }
+}
+
+# Fields the early-exit parser must find in <head> before it skips the body
+DEFAULT_EXTRACTION_PLAN = ('title', 'excerpt', 'image')
+
+HEAD_END_RE = re.compile(rb'</head\s*>', re.IGNORECASE)
+
+# Article discovery: 'auto' prefers RSS feeds and news sitemaps over section pages
+DISCOVERY_MODES = ('auto', 'sections')
+MAX_CHILD_SITEMAPS = 2
+
+# Scale mode: section pages walked per publication and fetched pages buffered ahead of extraction
+DEFAULT_MAX_PAGES = 50
+DEFAULT_PREFETCH = 8
+
+# Crawl daemon: sections are revisited between these intervals depending on how often they yield new articles
+DEFAULT_CRAWL_STATE = 'scraped_articles.crawl_state.json'
+DEFAULT_SECTION_INTERVAL = 900
+DEFAULT_MIN_INTERVAL = 120
+DEFAULT_MAX_INTERVAL = 6 * 3600
+DEFAULT_VISIT_LIMIT = 50
+DEFAULT_COMPACT_MINUTES = 15
+
+# Hero image resolution: the top candidates are validated concurrently with a short timeout
+IMAGE_VALIDATE_TOP = 3
+IMAGE_VALIDATE_WORKERS = 8
+IMAGE_VALIDATE_TIMEOUT = 3
+IMAGE_SKIP_WORDS = ('icon', 'logo', 'svg', 'ad-free', 'placeholder', 'blank.gif', 'spacer')
+IMAGE_DENSITY_WIDTH = 800  # width assumed per 1x density descriptor in srcset
+
+# Database sink: rows per bulk statement and per transaction
+DEFAULT_DB_BATCH = 500
+DEFAULT_DB_TRANSACTION_ROWS = 5000
+
+DEFAULT_CACHE_DIR = '.scrape_cache'
+DEFAULT_CACHE_TTL = 3600
+
+DEFAULT_OUTPUT = 'scraped_articles.json'
+DEFAULT_INDEX = 'scraped_articles.index.json'
+DEFAULT_RECHECK_HOURS = 24
+DEFAULT_STREAM = 'scraped_articles.jsonl'
+DEFAULT_FSYNC_EVERY = 20
+DEFAULT_ROTATE_MB = 64
+DEFAULT_DEDUP_INDEX = 'scraped_articles.dedup.json'
+DEFAULT_DEDUP_THRESHOLD = 0.6
+
+TRACKING_PARAM_PREFIXES = ('utm_', 'fbclid', 'gclid', 'ref', 'from')
+
+# Article fields that identify a version of an article (metrics/readTime are generated)
+CONTENT_FIELDS = ('title', 'excerpt', 'image', 'author', 'publishDate', 'body')
+
+
+def canonicalize_url(url):
+    """Normalize an article URL so trivially different links compare equal"""
+    parts = urlparse(url.strip())
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if not k.lower().startswith(TRACKING_PARAM_PREFIXES)]
+    path = re.sub(r'/{2,}', '/', parts.path).rstrip('/') or '/'
+    return urlunparse(((parts.scheme or 'https').lower(), parts.netloc.lower(), path, '',
+                       urlencode(sorted(query)), ''))
+
+
+def content_hash(article):
+    """Stable digest of the scraped (non-generated) article fields"""
+    payload = json.dumps([article.get(field) for field in CONTENT_FIELDS], ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def xml_local_name(tag):
+    """Element name without its namespace"""
+    return tag.rsplit('}', 1)[-1].lower() if isinstance(tag, str) else ''
+
+
+def normalize_feed_date(value):
+    """Convert RFC 822 (RSS) or ISO 8601 (sitemap) dates to YYYY-MM-DD"""
+    try:
+        return parsedate_to_datetime(value).date().isoformat()
+    except (TypeError, ValueError, IndexError):
+        return value[:10] if re.match(r'\d{4}-\d{2}-\d{2}', value) else None
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB, or None if unavailable"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return peak / (1024 * 1024) if os.uname().sysname == 'Darwin' else peak / 1024
+
+
+def bounded_prefetch(iterable, maxsize, stop):
+    """Run an iterator in a background thread, handing items over through a bounded queue
+
+    The producer blocks once maxsize items are waiting, so at most maxsize
+    fetched pages are held in memory ahead of the consumer.
+    """
+    items = queue.Queue(maxsize=maxsize)
+    done = object()
 
-class ArticleScraper:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+    def produce():
+        try:
+            for item in iterable:
+                items.put(item)
+                if stop.is_set():
+                    break
+        except Exception as e:
+            print(f"Fetch stage failed: {e}")
+        finally:
+            items.put(done)
+
+    worker = threading.Thread(target=produce, daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = items.get()
+            if item is done:
+                break
+            yield item
+    finally:
+        stop.set()
+        # Drain so a producer blocked on a full queue can see stop and exit
+        while worker.is_alive():
+            try:
+                items.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class RunStats:
+    """Per-publication, per-stage timings, byte counts and errors for one scraper run
+
+    Stages: dns, fetch, sleep (politeness delay), parse, image (hero image
+    candidates), body (article text), validate (hero image checks), extract
+    (whole record extraction, including all of the above but fetch), dedup
+    and output. Optionally keeps every span for a Chrome trace export.
+    """
+
+    STAGES = ('dns', 'fetch', 'sleep', 'parse', 'image', 'body', 'validate', 'extract', 'dedup', 'output')
+
+    def __init__(self, trace=False, capture=False):
+        self.durations = defaultdict(list)  # (publication, stage) -> [seconds]
+        self.bytes = defaultdict(int)
+        self.requests = defaultdict(int)
+        self.cached = defaultdict(int)
+        self.errors = defaultdict(Counter)
+        self.events = [] if trace else None
+        self.spans = [] if capture else None  # raw spans shipped back from extraction workers
+        self.origin = time.perf_counter()
+        self.host_to_publication = {urlparse(c['base_url']).netloc: key for key, c in PUBLICATIONS.items()}
+
+    def publication_for(self, url):
+        host = urlparse(url).netloc if '/' in url else url
+        return self.host_to_publication.get(host, 'other')
+
+    def record(self, publication, stage, start, seconds, pid=None, tid=None, **args):
+        self.durations[(publication, stage)].append(seconds)
+        if self.spans is not None:
+            self.spans.append((publication, stage, start, seconds, args))
+        if self.events is not None:
+            # perf_counter is system-wide monotonic, so worker span starts line up with ours
+            self.events.append({
+                'name': stage, 'cat': publication, 'ph': 'X',
+                'ts': (start - self.origin) * 1e6, 'dur': seconds * 1e6,
+                'pid': pid or os.getpid(), 'tid': tid or threading.get_ident(), 'args': args
+            })
+
+    @contextlib.contextmanager
+    def stage(self, publication, stage, **args):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(publication, stage, start, time.perf_counter() - start, **args)
+
+    def error(self, publication, error):
+        self.errors[publication][error if isinstance(error, str) else type(error).__name__] += 1
+
+    def add_response(self, publication, response):
+        """Count a response; bodies served from the HTTP cache are not downloaded bytes"""
+        if getattr(response, 'from_cache', False):
+            self.cached[publication] += 1
+            # A 304 revalidation is still a request on the wire, just without a body
+            if getattr(response, 'revalidated', False):
+                self.requests[publication] += 1
+        else:
+            self.requests[publication] += 1
+            self.bytes[publication] += len(response.content)
+        if response.status_code >= 400:
+            self.error(publication, f"HTTP {response.status_code}")
+
+    @contextlib.contextmanager
+    def instrument_dns(self):
+        """Time name resolution by wrapping socket.getaddrinfo for the duration of the run"""
+        original = socket.getaddrinfo
+
+        def timed_getaddrinfo(host, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(host, *args, **kwargs)
+            finally:
+                self.record(self.publication_for(str(host)), 'dns', start, time.perf_counter() - start, host=str(host))
+
+        socket.getaddrinfo = timed_getaddrinfo
+        try:
+            yield
+        finally:
+            socket.getaddrinfo = original
+
+    def report(self):
+        """Structured report: per publication, per stage count/total/p50/p90/p99 plus bytes and errors"""
+        publications = sorted({p for p, _ in self.durations} | set(self.bytes) | set(self.cached) | set(self.errors))
+        report = {'wall_seconds': time.perf_counter() - self.origin, 'publications': {}, 'stages': {}}
+
+        for publication in publications:
+            stages = {}
+            for stage in self.STAGES:
+                values = sorted(self.durations.get((publication, stage), []))
+                if values:
+                    stages[stage] = self.summarize(values)
+            report['publications'][publication] = {
+                'stages': stages,
+                'requests': self.requests.get(publication, 0),
+                'bytes': self.bytes.get(publication, 0),
+                'cached': self.cached.get(publication, 0),
+                'errors': dict(self.errors.get(publication, {}))
+            }
+
+        for stage in self.STAGES:
+            values = sorted(v for (_, st), vs in self.durations.items() if st == stage for v in vs)
+            if values:
+                report['stages'][stage] = self.summarize(values)
+        return report
+
+    def summarize(self, values):
+        return {
+            'count': len(values),
+            'total': sum(values),
+            'p50': percentile(values, 50),
+            'p90': percentile(values, 90),
+            'p99': percentile(values, 99)
+        }
+
+    def print_report(self):
+        report = self.report()
+        print(f"\nRun report ({report['wall_seconds']:.1f}s wall; fetch includes sleep, extract includes parse, image, body and validate):")
+        print(f"   {'publication':<16}{'stage':<9}{'count':>7}{'total s':>10}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}")
+        for publication, data in report['publications'].items():
+            for stage, st in data['stages'].items():
+                print(f"   {publication:<16}{stage:<9}{st['count']:>7}{st['total']:>10.2f}"
+                      f"{st['p50'] * 1000:>9.1f}{st['p90'] * 1000:>9.1f}{st['p99'] * 1000:>9.1f}")
+            errors = ', '.join(f"{k}: {v}" for k, v in sorted(data['errors'].items())) or 'none'
+            print(f"   {publication:<16}{data['requests']} requests, {data['bytes'] / 1024:.0f} KB downloaded, "
+                  f"{data['cached']} served from cache, errors: {errors}")
+
+    def write_report(self, path):
+        write_json_atomic(path, self.report())
+
+    def write_trace(self, path):
+        """Export spans in the Chrome trace event format (chrome://tracing, Perfetto)"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': self.events or [], 'displayTimeUnit': 'ms'}, f)
+
+
+# Per-process extractor used by the parsing pool
+_worker_scraper = None
+
+
+def init_extract_worker(parser, early_exit, extraction_plan, validate_images):
+    """Process pool initializer: build one extraction-only scraper per worker"""
+    global _worker_scraper
+    _worker_scraper = ArticleScraper(parser=parser, early_exit=early_exit, extraction_plan=extraction_plan,
+                                     cache_dir=None, validate_images=validate_images)
+
+
+def worker_ready():
+    """No-op task used to make the pool fork its workers up front"""
+    return os.getpid()
+
+
+def extract_in_worker(key, article_url, feed_fields, content):
+    """Parse and extract one article in a worker; returns only the compact record and timings"""
+    scraper = _worker_scraper
+    scraper.parse_times = []
+    scraper.stats = RunStats(capture=True)
+    image_stats = dict(scraper.images.stats)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        with scraper.stats.stage(key, 'extract', url=article_url):
+            article = scraper.extract_article(PUBLICATIONS[key], article_url, feed_fields, content)
+
+    return {
+        'article': article,
+        'parse_times': scraper.parse_times,
+        'spans': scraper.stats.spans,
+        'image_stats': {k: v - image_stats[k] for k, v in scraper.images.stats.items()},
+        'pid': os.getpid()
+    }
+
+
+class SeenIndex:
+    """Persistent index of canonical article URLs with content hashes and last-seen times"""
+
+    def __init__(self, path=DEFAULT_INDEX, recheck_after=DEFAULT_RECHECK_HOURS * 3600):
+        self.path = path
+        self.recheck_after = recheck_after
+        self.entries = {}
+        self.stats = {'skipped': 0, 'new': 0, 'changed': 0, 'unchanged': 0}
+
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+
+    def __contains__(self, canonical_url):
+        return canonical_url in self.entries
+
+    def needs_fetch(self, canonical_url):
+        """True for unseen articles and for seen ones due for a change check"""
+        entry = self.entries.get(canonical_url)
+        if entry is None:
+            return True
+        if time.time() - entry['checked_at'] >= self.recheck_after:
+            return True
+
+        self.stats['skipped'] += 1
+        return False
+
+    def record(self, canonical_url, digest):
+        """Record a fetched article; returns True when it is new or its content changed"""
+        now = time.time()
+        entry = self.entries.get(canonical_url)
+
+        if entry is None:
+            self.entries[canonical_url] = {'hash': digest, 'first_seen': now, 'last_seen': now, 'checked_at': now}
+            self.stats['new'] += 1
+            return True
+
+        entry['last_seen'] = entry['checked_at'] = now
+        if entry['hash'] == digest:
+            self.stats['unchanged'] += 1
+            return False
+
+        entry['hash'] = digest
+        self.stats['changed'] += 1
+        return True
+
+    def save(self):
+        with open(self.path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f)
+        os.replace(self.path + '.tmp', self.path)
+
+
+def merge_articles(existing, scraped):
+    """Merge newly scraped articles into an existing dataset, newest first"""
+    scraped_keys = {canonicalize_url(a['link']) for a in scraped}
+    return scraped + [a for a in existing if canonicalize_url(a['link']) not in scraped_keys]
+
+
+def write_json_atomic(path, data):
+    """Write a JSON file via a temp file so readers never see a partial file"""
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(path + '.tmp', path)
+
+
+class JsonlWriter:
+    """Append-only JSON Lines sink with batched fsync and size-based rotation"""
+
+    def __init__(self, path=DEFAULT_STREAM, fsync_every=DEFAULT_FSYNC_EVERY, rotate_bytes=DEFAULT_ROTATE_MB * 1024 * 1024):
+        self.path = path
+        self.fsync_every = fsync_every
+        self.rotate_bytes = rotate_bytes
+        self.pending = 0
+        self.written = 0
+        self.file = None
+        self.open()
+
+    def open(self):
+        self.file = open(self.path, 'a', encoding='utf-8')
+
+        # A crash can leave a partial last line; start on a fresh line so it stays isolated
+        if self.file.tell() > 0:
+            with open(self.path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    self.file.write('\n')
+
+    def write(self, article):
+        self.file.write(json.dumps(article, ensure_ascii=False) + '\n')
+        self.file.flush()
+        self.written += 1
+        self.pending += 1
+
+        if self.pending >= self.fsync_every:
+            self.sync()
+        if self.rotate_bytes and self.file.tell() >= self.rotate_bytes:
+            self.rotate()
+
+    def sync(self):
+        os.fsync(self.file.fileno())
+        self.pending = 0
+
+    def rotate(self):
+        """Close the active segment and move it aside under a sortable timestamped name"""
+        self.sync()
+        self.file.close()
+        os.replace(self.path, f"{self.path}.{datetime.now().strftime('%Y%m%dT%H%M%S%f')}")
+        self.open()
+
+    def close(self):
+        if self.file and not self.file.closed:
+            self.sync()
+            self.file.close()
+
+
+def rotated_segments(path):
+    """Rotated JSONL segments of path, oldest first"""
+    return sorted(p for p in glob.glob(glob.escape(path) + '.*') if not p.endswith('.tmp'))
+
+
+def read_jsonl_segments(path, segments=None):
+    """Yield articles from rotated segments (oldest first) and then the active file"""
+    segments = list(rotated_segments(path) if segments is None else segments)
+    if os.path.exists(path):
+        segments.append(path)
+
+    for segment in segments:
+        with open(segment, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # Partial line left by an interrupted write
+                    continue
 
-    def scrape_times_of_india(self, limit=2):
-        """Scrape articles from Times of India"""
-        articles = []
-        base_url = "https://timesofindia.indiatimes.com"
 
-        try:
-            # Scrape business section
-            response = self.session.get(f"{base_url}/business/india-business")
-            soup = BeautifulSoup(response.content, 'html.parser')
+def compact_jsonl(stream_path, output_path):
+    """Compact JSONL segments into the JSON array format, newest record per article first
+
+    Rotated segments are deleted once the output holding their records is on disk, so each
+    compaction only reads what was streamed since the last one. The active file is kept.
+    """
+    # Segments rotated while compacting are left for the next compaction
+    segments = rotated_segments(stream_path)
+    latest = {}
+    for article in read_jsonl_segments(stream_path, segments):
+        key = canonicalize_url(article['link'])
+        latest.pop(key, None)
+        latest[key] = article
+
+    scraped = list(reversed(latest.values()))
+    existing = []
+    if os.path.exists(output_path):
+        with open(output_path, 'r', encoding='utf-8') as f:
+            existing = json.load(f)
+
+    articles = merge_articles(existing, scraped)
+    write_json_atomic(output_path, articles)
+
+    for segment in segments:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(segment)
+    return articles
+
+
+DB_COLUMNS = ('canonical_url', 'link', 'title', 'publication', 'publication_logo', 'publish_date', 'category',
+              'excerpt', 'image', 'read_time', 'author', 'body', 'metrics', 'content_hash')
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scraped_articles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    canonical_url TEXT NOT NULL UNIQUE,
+    link TEXT NOT NULL,
+    title TEXT,
+    publication TEXT,
+    publication_logo TEXT,
+    publish_date TEXT,
+    category TEXT,
+    excerpt TEXT,
+    image TEXT,
+    read_time TEXT,
+    author TEXT,
+    body TEXT,
+    metrics TEXT,
+    content_hash TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)
+"""
 
-            # Find article links
-            article_links = soup.find_all('a', href=re.compile(r'/articleshow/'))
 
-            for link in article_links[:limit]:
-                try:
-                    article_url = urljoin(base_url, link['href'])
-                    if article_url in [a['link'] for a in articles]:
+def article_row(article):
+    return (canonicalize_url(article['link']), article['link'], article.get('title'), article.get('publication'),
+            article.get('publicationLogo'), article.get('publishDate'), article.get('category'),
+            article.get('excerpt'), article.get('image'), article.get('readTime'), article.get('author'),
+            article.get('body'), json.dumps(article.get('metrics') or {}), content_hash(article))
+
+
+def copy_text(value):
+    """Encode a value for PostgreSQL COPY text format"""
+    if value is None:
+        return '\\N'
+    return (str(value).replace('\\', '\\\\').replace('\t', '\\t')
+            .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+class ArticleDbSink:
+    """Bulk upsert sink into the scraped_articles table, keyed on canonical url
+
+    Rows are buffered and written one batch per bulk statement: COPY into a
+    temp staging table followed by one INSERT ... ON CONFLICT on PostgreSQL,
+    a single executemany upsert on SQLite. Transactions are committed every
+    transaction_rows rows. Rows whose content hash is unchanged are left
+    untouched, so re-runs are idempotent.
+
+    The PostgreSQL table comes from backend/database/migrations; SQLite
+    databases (the local stand-in) are created on first use.
+    """
+
+    def __init__(self, url, batch_size=DEFAULT_DB_BATCH, transaction_rows=DEFAULT_DB_TRANSACTION_ROWS):
+        self.batch_size = batch_size
+        self.transaction_rows = transaction_rows
+        self.pending = {}  # canonical url -> row; later writes of the same article replace earlier ones
+        self.uncommitted = 0
+        self.stats = {'rows': 0, 'batches': 0, 'statements': 0, 'transactions': 0}
+
+        parsed = urlparse(url)
+        if parsed.scheme in ('postgres', 'postgresql'):
+            if psycopg2 is None:
+                raise RuntimeError("psycopg2 is required for a PostgreSQL database sink (pip install psycopg2-binary)")
+            self.dialect = 'postgresql'
+            self.connection = psycopg2.connect(url)
+            self.execute("CREATE TEMP TABLE scraped_articles_staging "
+                         "(LIKE scraped_articles INCLUDING DEFAULTS) ON COMMIT DELETE ROWS")
+        elif parsed.scheme == 'sqlite':
+            self.dialect = 'sqlite'
+            self.connection = sqlite3.connect(url[len('sqlite:///'):] if url.startswith('sqlite:///') else parsed.path)
+            self.execute(SQLITE_SCHEMA)
+            self.connection.commit()
+        else:
+            raise ValueError(f"Unsupported database url {url!r}; expected sqlite:///path or postgresql://...")
+
+    def execute(self, sql, params=None):
+        cursor = self.connection.cursor()
+        cursor.execute(sql, params or ())
+        self.stats['statements'] += 1
+        return cursor
+
+    def write(self, article):
+        row = article_row(article)
+        self.pending[row[0]] = row
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        rows = list(self.pending.values())
+        self.pending = {}
+
+        updates = ', '.join(f"{column} = excluded.{column}" for column in DB_COLUMNS[1:])
+        if self.dialect == 'postgresql':
+            buffer = io.StringIO()
+            for row in rows:
+                buffer.write('\t'.join(copy_text(value) for value in row) + '\n')
+            buffer.seek(0)
+            self.connection.cursor().copy_from(buffer, 'scraped_articles_staging', columns=DB_COLUMNS)
+            self.stats['statements'] += 1
+            self.execute(f"INSERT INTO scraped_articles ({', '.join(DB_COLUMNS)}) "
+                         f"SELECT {', '.join(DB_COLUMNS)} FROM scraped_articles_staging "
+                         f"ON CONFLICT (canonical_url) DO UPDATE SET {updates}, updated_at = CURRENT_TIMESTAMP "
+                         f"WHERE scraped_articles.content_hash IS DISTINCT FROM excluded.content_hash")
+            self.execute("TRUNCATE scraped_articles_staging")
+        else:
+            self.connection.executemany(
+                f"INSERT INTO scraped_articles ({', '.join(DB_COLUMNS)}) VALUES ({', '.join('?' * len(DB_COLUMNS))}) "
+                f"ON CONFLICT (canonical_url) DO UPDATE SET {updates}, updated_at = CURRENT_TIMESTAMP "
+                f"WHERE scraped_articles.content_hash IS NOT excluded.content_hash", rows)
+            self.stats['statements'] += 1
+
+        self.stats['rows'] += len(rows)
+        self.stats['batches'] += 1
+        self.uncommitted += len(rows)
+        if self.uncommitted >= self.transaction_rows:
+            self.commit()
+
+    def commit(self):
+        if self.uncommitted:
+            self.connection.commit()
+            self.stats['transactions'] += 1
+            self.uncommitted = 0
+
+    def sync(self):
+        self.flush()
+        self.commit()
+
+    def close(self):
+        if self.connection is not None:
+            self.sync()
+            self.connection.close()
+            self.connection = None
+
+
+WORD_RE = re.compile(r'\w+', re.UNICODE)
+
+# MinHash parameters: 32 permutations split into 8 LSH bands of 4 rows
+MINHASH_PRIME = (1 << 61) - 1
+MINHASH_BANDS = 8
+MINHASH_ROWS = 4
+_minhash_rng = random.Random(2024)
+MINHASH_PERMUTATIONS = [(_minhash_rng.randrange(1, MINHASH_PRIME), _minhash_rng.randrange(MINHASH_PRIME))
+                        for _ in range(MINHASH_BANDS * MINHASH_ROWS)]
+
+
+def shingles(text):
+    """Word unigrams and bigrams of a text"""
+    words = WORD_RE.findall(text.lower())
+    return set(words) | {f"{a} {b}" for a, b in zip(words, words[1:])}
+
+
+def minhash(text):
+    """MinHash signature of a text, truncated to 16 bits per permutation"""
+    hashes = [int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=8).digest(), 'big')
+              for s in shingles(text)] or [0]
+    return [min((a * h + b) % MINHASH_PRIME for h in hashes) & 0xFFFF for a, b in MINHASH_PERMUTATIONS]
+
+
+class DuplicateDetector:
+    """MinHash/LSH near-duplicate index over article title and excerpt
+
+    Signatures are split into bands and bucketed per band, so a new article is
+    only compared with articles that share at least one band exactly instead
+    of the whole corpus.
+    """
+
+    def __init__(self, path=DEFAULT_DEDUP_INDEX, threshold=DEFAULT_DEDUP_THRESHOLD):
+        self.path = path
+        self.threshold = threshold
+        self.signatures = {}  # canonical url -> minhash signature
+        self.primary_of = {}  # canonical url of a duplicate -> canonical url of its cluster primary
+        self.clusters = {}    # canonical url of a primary -> canonical urls of its duplicates
+        self.buckets = [{} for _ in range(MINHASH_BANDS)]
+        self.stats = {'checked': 0, 'duplicates': 0, 'comparisons': 0}
+
+        if path and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.clusters = data.get('clusters', {})
+            for primary, duplicates in self.clusters.items():
+                for duplicate in duplicates:
+                    self.primary_of[duplicate] = primary
+            for url, packed in data.get('signatures', {}).items():
+                self._index(url, [int(packed[i:i + 4], 16) for i in range(0, len(packed), 4)])
+
+    def _band_keys(self, signature):
+        return [tuple(signature[i * MINHASH_ROWS:(i + 1) * MINHASH_ROWS]) for i in range(MINHASH_BANDS)]
+
+    def _index(self, url, signature):
+        self.signatures[url] = signature
+        for bucket, key in zip(self.buckets, self._band_keys(signature)):
+            bucket.setdefault(key, []).append(url)
+
+    def find(self, signature, exclude=None):
+        """Return the most similar indexed url at or above the threshold, or None"""
+        best, best_similarity = None, self.threshold
+        seen = set()
+        for bucket, key in zip(self.buckets, self._band_keys(signature)):
+            for url in bucket.get(key, ()):
+                if url == exclude or url in seen:
+                    continue
+                seen.add(url)
+                self.stats['comparisons'] += 1
+                other = self.signatures[url]
+                similarity = sum(1 for x, y in zip(signature, other) if x == y) / len(signature)
+                if similarity >= best_similarity:
+                    best, best_similarity = url, similarity
+        return best
+
+    def check(self, canonical_url, article):
+        """Index an article; returns its cluster primary if it is a near-duplicate, else None"""
+        self.stats['checked'] += 1
+
+        if canonical_url in self.signatures:
+            primary = self.primary_of.get(canonical_url)
+        else:
+            signature = minhash(f"{article['title']} {article['excerpt']}")
+            match = self.find(signature, exclude=canonical_url)
+            primary = self.primary_of.get(match, match) if match else None
+
+            # Duplicates are indexed too so later variants of the story still match the cluster
+            self._index(canonical_url, signature)
+            if primary:
+                self.primary_of[canonical_url] = primary
+                self.clusters.setdefault(primary, []).append(canonical_url)
+
+        if primary:
+            self.stats['duplicates'] += 1
+        return primary
+
+    def save(self):
+        data = {
+            'signatures': {url: ''.join(format(v, '04x') for v in sig) for url, sig in self.signatures.items()},
+            'clusters': self.clusters
+        }
+        with open(self.path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(self.path + '.tmp', self.path)
+
+
+# Search index: segments are merged once there are more than this many; pending postings are flushed every N docs
+DEFAULT_SEARCH_INDEX = 'scraped_articles.search'
+SEARCH_MAX_SEGMENTS = 8
+SEARCH_FLUSH_DOCS = 5000
+SEARCH_FIELD_GAP = 100  # position gap between title, excerpt and body so phrases don't span fields
+SEARCH_IMPACT_ORDER_DF = 1000  # terms in at least this many docs of a segment also store an impact-sorted order
+BM25_K1 = 1.2
+BM25_B = 0.75
+QUERY_RE = re.compile(r'"([^"]+)"|(\S+)')
+
+
+def tokenize(text):
+    return WORD_RE.findall(text.lower())
+
+
+class SearchSegment:
+    """Immutable on-disk postings for a contiguous range of doc ids
+
+    <name>.post holds, per term, the doc ids, position offsets (n + 1
+    entries), positions, BM25 term impacts and, for frequent terms, the
+    doc indexes sorted by descending impact; <name>.terms maps each term to
+    [byte offset, document count, position count, has impact order].
+    """
+
+    def __init__(self, directory, name):
+        self.name = name
+        self.post_path = os.path.join(directory, name + '.post')
+        with open(os.path.join(directory, name + '.terms'), 'r', encoding='utf-8') as f:
+            self.terms = json.load(f)
+        self.file = open(self.post_path, 'rb')
+        self.size = os.fstat(self.file.fileno()).st_size
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b''
+
+    def postings(self, term):
+        """(doc ids, position offsets, positions, impacts, impact order or None) for a term, or None"""
+        entry = self.terms.get(term)
+        if entry is None:
+            return None
+        offset, n, npos, ordered = entry
+        arrays = []
+        for typecode, count in (('I', n), ('I', n + 1), ('I', npos), ('f', n), ('I', n if ordered else 0)):
+            values = array(typecode)
+            values.frombytes(self.data[offset:offset + 4 * count])
+            arrays.append(values)
+            offset += 4 * count
+        if not ordered:
+            arrays[4] = None
+        return tuple(arrays)
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.file.close()
+
+    @staticmethod
+    def write(directory, name, entries):
+        """Write (term, doc ids, position offsets, positions, impacts) entries, sorted by term, as a segment"""
+        terms = {}
+        offset = 0
+        with open(os.path.join(directory, name + '.post'), 'wb') as f:
+            for term, doc_ids, offsets, positions, impacts in entries:
+                parts = [doc_ids, offsets, positions, impacts]
+                if len(doc_ids) >= SEARCH_IMPACT_ORDER_DF:
+                    parts.append(array('I', sorted(range(len(impacts)), key=impacts.__getitem__, reverse=True)))
+                for values in parts:
+                    f.write(values.tobytes())
+                terms[term] = [offset, len(doc_ids), len(positions), len(parts) == 5]
+                offset += sum(4 * len(values) for values in parts)
+            f.flush()
+            os.fsync(f.fileno())
+        with open(os.path.join(directory, name + '.terms.tmp'), 'w', encoding='utf-8') as f:
+            json.dump(terms, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(os.path.join(directory, name + '.terms.tmp'), os.path.join(directory, name + '.terms'))
+
+
+def bm25_impact(tf, length, avg_length):
+    """Per-document part of a term's BM25 score; the query multiplies it by the term's idf"""
+    return tf * (BM25_K1 + 1) / (tf + BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length))
+
+
+def pending_entries(pending, lengths, avg_length):
+    """Segment entries for in-memory postings ({term: [(doc id, [positions])]})"""
+    for term in sorted(pending):
+        doc_ids = array('I')
+        offsets = array('I', [0])
+        positions = array('I')
+        impacts = array('f')
+        for doc_id, term_positions in pending[term]:
+            doc_ids.append(doc_id)
+            positions.extend(term_positions)
+            offsets.append(len(positions))
+            impacts.append(bm25_impact(len(term_positions), lengths[doc_id], avg_length))
+        yield term, doc_ids, offsets, positions, impacts
+
+
+def merged_entries(segments, deleted):
+    """Segment entries concatenating each term's postings across segments, minus deleted docs"""
+    for term in sorted(set().union(*(segment.terms for segment in segments))):
+        doc_ids = array('I')
+        offsets = array('I', [0])
+        positions = array('I')
+        impacts = array('f')
+        for segment in segments:
+            found = segment.postings(term)
+            if found is None:
+                continue
+            ids, offs, pos, imps, _ = found
+            if deleted and not deleted.isdisjoint(ids):
+                for j, doc_id in enumerate(ids):
+                    if doc_id not in deleted:
+                        doc_ids.append(doc_id)
+                        positions.extend(pos[offs[j]:offs[j + 1]])
+                        offsets.append(len(positions))
+                        impacts.append(imps[j])
+            else:
+                base = len(positions)
+                doc_ids.extend(ids)
+                offsets.extend(base + o for o in offs[1:])
+                positions.extend(pos)
+                impacts.extend(imps)
+        if doc_ids:
+            yield term, doc_ids, offsets, positions, impacts
+
+
+class SearchIndex:
+    """Incremental on-disk inverted index over title, excerpt and body
+
+    Works as an output sink: written articles are buffered in memory and
+    flushed as immutable segments; adjacent small segments are merged so
+    queries touch a handful of files. Re-written articles (same canonical
+    url) get a new doc id and the old one is tombstoned until the next
+    merge drops it. Queries are keyword and "quoted phrase" conjunctions
+    ranked with BM25.
+
+    Length normalization uses the average document length of the first
+    flush, so each posting's BM25 impact is fixed at index time. Frequent
+    terms also store their postings in impact order, which lets a query
+    stop as soon as no remaining document can enter the top results.
+    """
+
+    def __init__(self, directory=DEFAULT_SEARCH_INDEX, flush_docs=SEARCH_FLUSH_DOCS):
+        self.directory = directory
+        self.flush_docs = flush_docs
+        os.makedirs(directory, exist_ok=True)
+        self.manifest_path = os.path.join(directory, 'manifest.json')
+        self.docs_path = os.path.join(directory, 'docs.jsonl')
+        self.doc_offsets_path = os.path.join(directory, 'docs.idx')
+
+        manifest = {'segments': [], 'next_doc': 0, 'next_segment': 0, 'deleted': [], 'avg_length': None}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest.update(json.load(f))
+        self.next_doc = manifest['next_doc']
+        self.next_segment = manifest['next_segment']
+        self.deleted = set(manifest['deleted'])
+        self.avg_length = manifest['avg_length']
+        self.segments = [SearchSegment(directory, name) for name in manifest['segments']]
+
+        # The doc table is appended before the manifest is replaced; drop anything an interrupted flush left behind
+        self.doc_offsets = array('Q')
+        if os.path.exists(self.doc_offsets_path):
+            with open(self.doc_offsets_path, 'rb') as f:
+                self.doc_offsets.frombytes(f.read(8 * (self.next_doc + 1)))
+        if len(self.doc_offsets) > self.next_doc:
+            self._truncate(self.docs_path, self.doc_offsets[self.next_doc])
+            del self.doc_offsets[self.next_doc:]
+        self._truncate(self.doc_offsets_path, 8 * self.next_doc)
+
+        self.doc_of_url = None  # canonical url -> doc id, loaded on first write
+        self.pending = defaultdict(list)
+        self.pending_docs = []
+        self.written = 0
+
+    @staticmethod
+    def _truncate(path, size):
+        if os.path.exists(path) and os.path.getsize(path) > size:
+            with open(path, 'r+b') as f:
+                f.truncate(size)
+
+    @property
+    def live_docs(self):
+        return self.next_doc + len(self.pending_docs) - len(self.deleted)
+
+    def _load_urls(self):
+        self.doc_of_url = {}
+        if os.path.exists(self.docs_path):
+            with open(self.docs_path, 'rb') as f:
+                for line in f:
+                    doc = json.loads(line)
+                    self.doc_of_url[doc['key']] = doc['id']
+
+    def write(self, article):
+        if self.doc_of_url is None:
+            self._load_urls()
+
+        key = canonicalize_url(article['link'])
+        doc_id = self.next_doc + len(self.pending_docs)
+        previous = self.doc_of_url.get(key)
+        if previous is not None:
+            self.deleted.add(previous)
+        self.doc_of_url[key] = doc_id
+
+        position = 0
+        positions = defaultdict(list)
+        for field in ('title', 'excerpt', 'body'):
+            for token in tokenize(article.get(field) or ''):
+                positions[token].append(position)
+                position += 1
+            position += SEARCH_FIELD_GAP
+        for term, term_positions in positions.items():
+            self.pending[term].append((doc_id, term_positions))
+
+        self.pending_docs.append(({'id': doc_id, 'key': key, 'link': article['link'], 'title': article.get('title'),
+                                   'publication': article.get('publication'),
+                                   'publishDate': article.get('publishDate')}, position - 3 * SEARCH_FIELD_GAP))
+        self.written += 1
+        if len(self.pending_docs) >= self.flush_docs:
+            self.flush()
+
+    def flush(self):
+        """Write pending documents as a new segment and merge segments if there are too many"""
+        if not self.pending_docs:
+            return
+
+        lengths = {doc['id']: length for doc, length in self.pending_docs}
+        if self.avg_length is None:
+            self.avg_length = max(sum(lengths.values()) / len(lengths), 1)
+
+        offsets = array('Q')
+        with open(self.docs_path, 'ab') as f:
+            offset = f.tell()
+            for doc, _ in self.pending_docs:
+                offsets.append(offset)
+                line = json.dumps(doc, ensure_ascii=False).encode('utf-8') + b'\n'
+                f.write(line)
+                offset += len(line)
+            f.flush()
+            os.fsync(f.fileno())
+        with open(self.doc_offsets_path, 'ab') as f:
+            f.write(offsets.tobytes())
+        self.doc_offsets.extend(offsets)
+
+        name = f"seg-{self.next_segment:06d}"
+        SearchSegment.write(self.directory, name, pending_entries(self.pending, lengths, self.avg_length))
+        self.segments.append(SearchSegment(self.directory, name))
+        self.next_segment += 1
+        self.next_doc += len(self.pending_docs)
+        self.pending = defaultdict(list)
+        self.pending_docs = []
+
+        while len(self.segments) > SEARCH_MAX_SEGMENTS:
+            # Merge the smallest adjacent pair, keeping doc id ranges in order
+            i = min(range(len(self.segments) - 1),
+                    key=lambda i: self.segments[i].size + self.segments[i + 1].size)
+            self.merge(i)
+        self.save_manifest()
+
+    def merge(self, i):
+        """Merge segments i and i + 1, dropping postings of deleted documents"""
+        first, second = self.segments[i], self.segments[i + 1]
+        name = f"seg-{self.next_segment:06d}"
+        self.next_segment += 1
+        SearchSegment.write(self.directory, name, merged_entries([first, second], self.deleted))
+        self.segments[i:i + 2] = [SearchSegment(self.directory, name)]
+        self.save_manifest()
+        for segment in (first, second):
+            segment.close()
+            os.remove(segment.post_path)
+            os.remove(os.path.join(self.directory, segment.name + '.terms'))
+
+    def save_manifest(self):
+        write_json_atomic(self.manifest_path, {
+            'segments': [segment.name for segment in self.segments], 'next_doc': self.next_doc,
+            'next_segment': self.next_segment, 'deleted': sorted(self.deleted), 'avg_length': self.avg_length
+        })
+
+    def sync(self):
+        self.flush()
+
+    def close(self):
+        self.flush()
+        for segment in self.segments:
+            segment.close()
+        self.segments = []
+
+    def document(self, doc_id):
+        with open(self.docs_path, 'rb') as f:
+            f.seek(self.doc_offsets[doc_id])
+            return json.loads(f.readline())
+
+    def search(self, query, limit=10):
+        """Return the top documents matching every keyword and phrase, best first, with scores"""
+        phrases, keywords = [], []
+        for phrase, word in QUERY_RE.findall(query):
+            tokens = tokenize(phrase or word)
+            if len(tokens) > 1:
+                phrases.append(tokens)
+            keywords.extend(tokens)
+        terms = list(dict.fromkeys(keywords))
+        if not terms or not self.next_doc:
+            return []
+
+        per_segment = [{term: segment.postings(term) for term in terms} for segment in self.segments]
+        doc_count = max(self.live_docs, 1)
+        idf = {}
+        for term in terms:
+            df = sum(len(postings[term][0]) for postings in per_segment if postings[term])
+            idf[term] = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+
+        top = []  # min-heap of (score, doc id), shared across segments
+        for postings in per_segment:
+            if not all(postings.values()):
+                continue
+
+            # Walk the rarest term's documents and binary-search the others; when that term
+            # has an impact order, stop once no remaining document can beat the current top
+            order = sorted(terms, key=lambda t: len(postings[t][0]))
+            doc_ids, _, _, impacts, by_impact = postings[order[0]]
+            rest_bound = sum(idf[term] * (BM25_K1 + 1) for term in order[1:])
+            for j in by_impact if by_impact is not None else range(len(doc_ids)):
+                if by_impact is not None and len(top) == limit and idf[order[0]] * impacts[j] + rest_bound <= top[0][0]:
+                    break
+                doc_id = doc_ids[j]
+                if doc_id in self.deleted:
+                    continue
+                at = {order[0]: j}
+                for term in order[1:]:
+                    term_doc_ids = postings[term][0]
+                    k = bisect_left(term_doc_ids, doc_id)
+                    if k == len(term_doc_ids) or term_doc_ids[k] != doc_id:
+                        break
+                    at[term] = k
+                else:
+                    if phrases and not all(self._has_phrase(postings, at, phrase) for phrase in phrases):
                         continue
+                    score = sum(idf[term] * postings[term][3][k] for term, k in at.items())
+                    if len(top) < limit:
+                        heapq.heappush(top, (score, doc_id))
+                    elif score > top[0][0]:
+                        heapq.heapreplace(top, (score, doc_id))
+
+        return [dict(self.document(doc_id), score=round(score, 4)) for score, doc_id in sorted(top, reverse=True)]
+
+    @staticmethod
+    def _has_phrase(postings, at, phrase):
+        starts = None
+        for i, term in enumerate(phrase):
+            offsets, positions = postings[term][1], postings[term][2]
+            k = at[term]
+            shifted = {p - i for p in positions[offsets[k]:offsets[k + 1]]}
+            starts = shifted if starts is None else starts & shifted
+            if not starts:
+                return False
+        return True
+
+
+def build_response(request, status, headers, body, from_cache=False):
+    """Build a requests Response from stored parts"""
+    response = requests.Response()
+    response.status_code = status
+    response.reason = 'OK' if status == 200 else ''
+    response.headers = CaseInsensitiveDict(headers)
+    response.encoding = get_encoding_from_headers(response.headers)
+    response._content = body
+    response.url = request.url
+    response.request = request
+    response.from_cache = from_cache
+    return response
+
+
+class PageArchive:
+    """Zip archive of recorded responses, keyed by URL, for offline replay"""
+
+    INDEX_NAME = 'index.json'
+
+    def __init__(self, path, mode='r'):
+        self.path = path
+        self.mode = mode
+        self.index = {}
+        self.misses = 0
+
+        if mode == 'r':
+            self.zip = zipfile.ZipFile(path, 'r')
+            self.index = json.loads(self.zip.read(self.INDEX_NAME))
+        else:
+            self.zip = zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=6)
+
+    def record(self, response, *args, **kwargs):
+        """requests response hook: store the first response seen for each URL"""
+        url = response.request.url if response.request else response.url
+        if response.request is not None and response.request.method != 'GET':
+            return response
+        if url in self.index or response.status_code == 304:
+            return response
+
+        name = 'bodies/' + hashlib.sha256(url.encode('utf-8')).hexdigest()
+        self.zip.writestr(name, response.content)
+        self.index[url] = {
+            'status': response.status_code,
+            'headers': {k: v for k, v in response.headers.items()
+                        if k.lower() not in ('content-encoding', 'content-length', 'transfer-encoding')},
+            'body': name
+        }
+        return response
+
+    def get(self, url):
+        entry = self.index.get(url)
+        if entry is None:
+            self.misses += 1
+            return None
+        return entry['status'], entry['headers'], self.zip.read(entry['body'])
+
+    def close(self):
+        if self.mode != 'r':
+            self.zip.writestr(self.INDEX_NAME, json.dumps(self.index))
+        self.zip.close()
+
+
+class ReplayAdapter(HTTPAdapter):
+    """Transport adapter that answers every request from a PageArchive, never the network"""
+
+    def __init__(self, archive, **kwargs):
+        super().__init__(**kwargs)
+        self.archive = archive
+
+    def send(self, request, stream=False, **kwargs):
+        entry = self.archive.get(request.url)
+        if entry is None:
+            return build_response(request, 404, {}, b'')
+        status, headers, body = entry
+        return build_response(request, status, headers, body)
+
+
+class HttpCache:
+    """On-disk HTTP response cache with gzip-compressed bodies"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, default_ttl=DEFAULT_CACHE_TTL, ttl_by_host=None):
+        self.cache_dir = cache_dir
+        self.default_ttl = default_ttl
+        self.ttl_by_host = ttl_by_host or {}
+        self.stats = {'hits': 0, 'revalidated': 0, 'misses': 0, 'stored': 0, 'bytes_saved': 0}
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def ttl_for(self, url):
+        return self.ttl_by_host.get(urlparse(url).netloc, self.default_ttl)
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return base + '.json', base + '.body.gz'
+
+    def load(self, url):
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with gzip.open(body_path, 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        return meta, body
+
+    def store(self, url, status, headers, body):
+        meta_path, body_path = self._paths(url)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+
+        # The stored body is already decoded, so transfer headers no longer apply
+        headers = {k: v for k, v in headers.items()
+                   if k.lower() not in ('content-encoding', 'content-length', 'transfer-encoding')}
+        meta = {
+            'url': url,
+            'status': status,
+            'headers': headers,
+            'etag': headers.get('ETag') or headers.get('etag'),
+            'last_modified': headers.get('Last-Modified') or headers.get('last-modified'),
+            'stored_at': time.time()
+        }
+
+        # Write the body before the metadata so a crash never leaves metadata without a body
+        with gzip.open(body_path + '.tmp', 'wb', compresslevel=6) as f:
+            f.write(body)
+        os.replace(body_path + '.tmp', body_path)
+        self.touch(url, meta)
+        self.stats['stored'] += 1
+
+    def touch(self, url, meta):
+        meta_path, _ = self._paths(url)
+        meta['stored_at'] = time.time()
+        with open(meta_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(meta_path + '.tmp', meta_path)
+
+    def is_fresh(self, url, meta):
+        return time.time() - meta['stored_at'] < self.ttl_for(url)
+
+
+class GovernedAdapter(HTTPAdapter):
+    """Transport adapter that paces every network request through a CrawlGovernor"""
+
+    def __init__(self, governor=None, **kwargs):
+        super().__init__(**kwargs)
+        self.governor = governor
+
+    def send(self, request, **kwargs):
+        if self.governor is None:
+            return super().send(request, **kwargs)
+
+        self.governor.acquire(request.url)
+        start = time.perf_counter()
+        try:
+            response = super().send(request, **kwargs)
+        except requests.RequestException:
+            self.governor.observe(request.url, None)
+            raise
+
+        self.governor.observe(request.url, response.status_code, time.perf_counter() - start,
+                              parse_retry_after(response.headers.get('Retry-After')))
+        return response
+
+
+class CachingAdapter(GovernedAdapter):
+    """Transport adapter that serves GETs from HttpCache and revalidates stale entries"""
+
+    def __init__(self, cache, governor=None, **kwargs):
+        super().__init__(governor=governor, **kwargs)
+        self.cache = cache
+
+    def build_cached_response(self, request, meta, body):
+        return build_response(request, meta['status'], meta['headers'], body, from_cache=True)
+
+    def send(self, request, stream=False, **kwargs):
+        if request.method != 'GET' or stream:
+            return super().send(request, stream=stream, **kwargs)
+
+        # 'Cache-Control: no-cache' asks this cache to revalidate even a fresh entry; it is not forwarded
+        revalidate = 'no-cache' in request.headers.pop('Cache-Control', '').lower()
+
+        cached = self.cache.load(request.url)
+        if cached:
+            meta, body = cached
+            if not revalidate and self.cache.is_fresh(request.url, meta):
+                self.cache.stats['hits'] += 1
+                self.cache.stats['bytes_saved'] += len(body)
+                return self.build_cached_response(request, meta, body)
+
+            # Stale entry: ask the server whether it changed
+            if meta.get('etag'):
+                request.headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                request.headers['If-Modified-Since'] = meta['last_modified']
+
+        response = super().send(request, stream=stream, **kwargs)
+
+        if cached and response.status_code == 304:
+            meta, body = cached
+            self.cache.touch(request.url, meta)
+            self.cache.stats['revalidated'] += 1
+            self.cache.stats['bytes_saved'] += len(body)
+            response = self.build_cached_response(request, meta, body)
+            response.revalidated = True
+            return response
+
+        self.cache.stats['misses'] += 1
+        cache_control = response.headers.get('Cache-Control', '').lower()
+        if response.status_code == 200 and 'no-store' not in cache_control:
+            self.cache.store(request.url, response.status_code, dict(response.headers), response.content)
+
+        response.from_cache = False
+        return response
+
+
+def parse_dimension(value):
+    """Integer pixel size from an attribute like '640' or '640px', else 0"""
+    match = re.match(r'\s*(\d+)', value or '')
+    return int(match.group(1)) if match else 0
+
+
+def parse_srcset(value):
+    """(url, width) pairs from a srcset attribute; density descriptors are converted to widths
+
+    URLs may contain commas (e.g. ET's thumbnail URLs), so candidates are
+    split on whitespace first, as browsers do, rather than on commas.
+    """
+    candidates = []
+    pos, n = 0, len(value)
+    while pos < n:
+        while pos < n and (value[pos].isspace() or value[pos] == ','):
+            pos += 1
+        start = pos
+        while pos < n and not value[pos].isspace():
+            pos += 1
+        url, descriptor = value[start:pos], ''
+        if url.endswith(','):
+            url = url.rstrip(',')
+        else:
+            start = pos
+            while pos < n and value[pos] != ',':
+                pos += 1
+            descriptor = value[start:pos].strip()
+
+        width = 0
+        try:
+            if descriptor.endswith('w'):
+                width = int(float(descriptor[:-1]))
+            elif descriptor.endswith('x'):
+                width = int(float(descriptor[:-1]) * IMAGE_DENSITY_WIDTH)
+        except ValueError:
+            pass
+        if url:
+            candidates.append((url, width))
+    return candidates
+
+
+class ImageResolver:
+    """Validate ranked hero image candidates concurrently and pick the best real one
+
+    The top candidates are checked in parallel with HEAD requests (GET for
+    servers that refuse HEAD) over a dedicated pooled session, so an article
+    costs at most one round trip of the short timeout. Images are served from
+    CDNs, so these requests bypass the crawl governor and the page cache.
+    Results are remembered, since shared images recur across articles.
+    """
+
+    def __init__(self, validate=True, top=IMAGE_VALIDATE_TOP, workers=IMAGE_VALIDATE_WORKERS,
+                 timeout=IMAGE_VALIDATE_TIMEOUT):
+        self.validate = validate
+        self.top = top
+        self.workers = workers
+        self.timeout = timeout
+        self.checked = {}  # url -> bool
+        self.executor = None
+        self.stats = {'resolved': 0, 'validated': 0, 'rejected': 0, 'cached': 0, 'unresolved': 0}
 
-                    article_response = self.session.get(article_url)
-                    article_soup = BeautifulSoup(article_response.content, 'html.parser')
-
-                    # Extract title
-                    title_elem = article_soup.find('h1', {'data-article-title': True}) or article_soup.find('h1')
-                    title = title_elem.get_text().strip() if title_elem else "Article Title"
-
-                    # Extract excerpt/description
-                    meta_desc = article_soup.find('meta', {'name': 'description'})
-                    excerpt = meta_desc['content'] if meta_desc else title[:150] + "..."
-
-                    # Get image - look for article hero image or main image
-                    img_elem = None
-
-                    # Try different selectors for article images
-                    selectors = [
-                        'img[data-src]',
-                        'img[src*="photo"]',
-                        'img[alt*="article"]',
-                        '.article-image img',
-                        '.hero-image img',
-                        'figure img',
-                        'img[alt]'
-                    ]
-
-                    for selector in selectors:
-                        if 'img[' in selector:
-                            # CSS selector with attributes
-                            attr_name = selector.split('[')[1].split(']')[0].split('=')[0]
-                            attr_value = selector.split('=')[1].strip('"]') if '=' in selector else None
-
-                            if attr_value:
-                                img_elem = article_soup.find('img', {attr_name: lambda x: x and attr_value in x})
-                            else:
-                                img_elem = article_soup.find('img', {attr_name: True})
-                        else:
-                            # CSS class selector
-                            container = article_soup.select_one(selector)
-                            if container:
-                                img_elem = container if container.name == 'img' else container.find('img')
-
-                        if img_elem:
-                            break
-
-                    if img_elem:
-                        # Try data-src first, then src
-                        image = (img_elem.get('data-src') or
-                                img_elem.get('src', ''))
-
-                        # Make sure it's a full URL
-                        if image and not image.startswith('http'):
-                            image = urljoin(base_url, image)
-
-                        # Skip if it's an icon or logo
-                        if image and any(skip in image.lower() for skip in ['icon', 'logo', 'svg', 'ad-free']):
-                            image = f"https://static.toiimg.com/photo/{random.randint(100000, 999999)}.cms"
-                    else:
-                        image = f"https://static.toiimg.com/photo/{random.randint(100000, 999999)}.cms"
-
-                    # Get author
-                    author_elem = article_soup.find('a', {'class': 'auth_detail'})
-                    author = author_elem.text.strip() if author_elem else "TOI Correspondent"
-
-                    # Get publish date
-                    date_elem = article_soup.find('span', {'class': 'date'})
-                    publish_date = date_elem.text.strip() if date_elem else "2024-12-01"
-
-                    articles.append({
-                        'title': title,
-                        'publication': 'The Times of India',
-                        'publicationLogo': 'https://static.toiimg.com/photo/47529300.cms',
-                        'publishDate': publish_date,
-                        'category': 'Business',
-                        'excerpt': excerpt,
-                        'image': image,
-                        'readTime': f"{random.randint(3, 8)} min read",
-                        'author': author,
-                        'link': article_url,
-                        'metrics': {
-                            'views': f"{random.randint(50, 200)}K",
-                            'shares': f"{random.randint(1, 5)}.{random.randint(0, 9)}K",
-                            'engagement': f"{random.randint(5, 12)}.{random.randint(0, 9)}%"
-                        }
-                    })
-
-                    time.sleep(random.uniform(1, 3))  # Respectful delay
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': ROBOTS_USER_AGENT})
+        adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
 
-                except Exception as e:
-                    print(f"Error scraping TOI article: {e}")
-                    continue
+    def is_image(self, url):
+        try:
+            response = self.session.head(url, timeout=self.timeout, allow_redirects=True)
+            if response.status_code in (403, 405, 501):
+                response = self.session.get(url, timeout=self.timeout, stream=True)
+                response.close()
+            ok = response.status_code < 400 and response.headers.get('Content-Type', '').startswith('image/')
+        except requests.RequestException:
+            ok = False
+
+        if len(self.checked) > 50000:
+            self.checked.clear()
+        self.checked[url] = ok
+        self.stats['validated' if ok else 'rejected'] += 1
+        return ok
+
+    def resolve(self, candidates):
+        """The highest-ranked candidate among the top few that is really an image, or None"""
+        top = candidates[:self.top]
+        if not self.validate:
+            return top[0] if top else None
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='image')
+        futures = {url: self.executor.submit(self.is_image, url) for url in top if url not in self.checked}
+        self.stats['cached'] += len(top) - len(futures)
+        try:
+            # Take results in rank order; lower-ranked checks still running are abandoned
+            for url in top:
+                if url in futures:
+                    ok = futures[url].result()
+                else:
+                    ok = self.checked.get(url, False)
+                if ok:
+                    self.stats['resolved'] += 1
+                    return url
+        finally:
+            for future in futures.values():
+                future.cancel()
+
+        self.stats['unresolved'] += 1
+        return None
 
-        except Exception as e:
-            print(f"Error scraping Times of India: {e}")
 
-        return articles
+class ArticleScraper:
+    def __init__(self, parser=None, early_exit=False, extraction_plan=DEFAULT_EXTRACTION_PLAN,
+                 cache_dir=DEFAULT_CACHE_DIR, seen_index=None, dedup=None, sinks=None,
+                 discovery='auto', discovery_sitemaps=True, max_pages=1, prefetch=0, keep_articles=True,
+                 record=None, replay=None, trace=False, workers=0, governor_options=None,
+                 validate_images=True):
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        })
 
-    def scrape_hindustan_times(self, limit=2):
-        """Scrape articles from Hindustan Times"""
-        articles = []
-        base_url = "https://www.hindustantimes.com"
+        self.parser = parser or DEFAULT_PARSER
+        self.early_exit = early_exit
+        self.extraction_plan = tuple(extraction_plan)
+        self.parse_times = []
+        # Set by the crawl daemon: feeds, sitemaps and section pages skip cache freshness and revalidate
+        self.revalidate_discovery = False
+        self.stats = RunStats(trace=trace)
+        self.extract_times = {}
+        self.publication_times = {}
+
+        # Network requests are paced per domain; cache hits and replays never reach the governor
+        self.cache = None
+        self.governor = None
+        if replay:
+            # Replayed runs are offline and deterministic: no cache, no delays
+            adapter = ReplayAdapter(replay)
+        else:
+            self.governor = CrawlGovernor(fetch_robots=lambda url: self.session.get(url, timeout=10),
+                                          stats=self.stats, **(governor_options or {}))
+            if cache_dir:
+                # Cache every GET on disk; TTLs are configured per publication host
+                ttl_by_host = {urlparse(c['base_url']).netloc: c['cache_ttl'] for c in PUBLICATIONS.values()}
+                self.cache = HttpCache(cache_dir, ttl_by_host=ttl_by_host)
+                adapter = CachingAdapter(self.cache, governor=self.governor)
+            else:
+                adapter = GovernedAdapter(self.governor)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Record every response into a page archive for later replay
+        if record:
+            self.session.hooks['response'].append(record.record)
+
+        # Incremental mode: skip articles already in the persistent index
+        self.seen_index = seen_index
+        self.seen_this_run = set()
+
+        # Near-duplicate stories across publications are clustered, not stored again
+        self.dedup = dedup
+
+        # Prefer feeds/sitemaps for discovery; section pages are the fallback
+        self.discovery = discovery
+        self.discovery_sitemaps = discovery_sitemaps
+
+        # Scale mode walks section pagination and pipelines fetching with extraction
+        self.max_pages = max_pages
+        self.prefetch = prefetch
+        self.keep_articles = keep_articles
+        self.article_counts = {}
+        self.total_articles = 0
+        self.started_at = time.perf_counter()
+
+        # Parsing/extraction can run in a process pool while this process keeps fetching
+        self.workers = workers
+        self.pool = None
+
+        # Output sinks receive each article as soon as it is extracted
+        self.sinks = list(sinks or [])
+
+        # Hero images are validated over the network, except in offline replays
+        self.validate_images = validate_images and not replay
+        self.images = ImageResolver(validate=self.validate_images)
+
+    def fetch(self, url, retries=2, **kwargs):
+        """GET through the session, recording fetch time, bytes and errors
+
+        Refuses URLs disallowed by robots.txt and retries 429/503 answers; the
+        governor has already pushed the domain's next slot past Retry-After.
+        """
+        publication = self.stats.publication_for(url)
+        if self.governor is not None and not self.governor.allowed(url):
+            self.stats.error(publication, 'robots.txt disallowed')
+            raise RobotsDisallowed(url)
 
         try:
-            response = self.session.get(f"{base_url}/india-news")
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            article_links = soup.find_all('a', href=re.compile(r'/india-news/'))
+            with self.stats.stage(publication, 'fetch', url=url):
+                response = self.session.get(url, **kwargs)
+                response.content  # read the body inside the timed span
+        except Exception as e:
+            self.stats.error(publication, e)
+            raise
+        self.stats.add_response(publication, response)
+
+        if response.status_code in (429, 503) and retries > 0:
+            return self.fetch(url, retries=retries - 1, **kwargs)
+        return response
+
+    def parse_html(self, content, url, mode='full', parse_only=None):
+        """Parse HTML with the configured backend and record the parse time"""
+        start = time.perf_counter()
+        soup = BeautifulSoup(content, self.parser, parse_only=parse_only)
+        elapsed = time.perf_counter() - start
+        self.stats.record(self.stats.publication_for(url), 'parse', start, elapsed, url=url, mode=mode)
+
+        self.parse_times.append({
+            'url': url,
+            'parser': self.parser,
+            'mode': mode,
+            'bytes': len(content),
+            'seconds': elapsed
+        })
+        print(f"   Parsed {url} in {elapsed * 1000:.1f} ms ({mode}, {self.parser}, {len(content) // 1024} KB)")
+        return soup
+
+    def extract_head_fields(self, head_soup):
+        """Extract the fields that publishers expose as <head> metadata"""
+        def meta(*keys):
+            for key in keys:
+                elem = head_soup.find('meta', {'property': key}) or head_soup.find('meta', {'name': key})
+                if elem and elem.get('content'):
+                    return elem['content'].strip()
+            return None
+
+        title = meta('og:title', 'twitter:title')
+        if not title and head_soup.title and head_soup.title.string:
+            title = head_soup.title.string.strip()
+
+        publish_date = meta('article:published_time', 'publish-date', 'date')
+        if publish_date:
+            publish_date = publish_date[:10]
+
+        return {
+            'title': title,
+            'excerpt': meta('description', 'og:description'),
+            'image': meta('og:image', 'twitter:image'),
+            'author': meta('author', 'article:author'),
+            'publishDate': publish_date
+        }
+
+    def image_candidates(self, article_soup, config, article_url):
+        """Every plausible hero image on the page, best first
+
+        Candidates come from og:image/twitter:image, <picture> sources, img
+        srcset variants and img src/data-src. They are ranked by source (meta
+        tags, then images in a <figure>/<picture> or on the publication's
+        image host, then other images), then by declared width in 200px
+        steps, then by position in the document.
+        """
+        found = {}  # url -> (rank key)
+
+        def add(url, width, weight):
+            if not url or url.startswith('data:'):
+                return
+            url = urljoin(article_url, url.strip())
+            if any(skip in url.lower() for skip in IMAGE_SKIP_WORDS):
+                return
+            key = (-weight, -min(width, 2000) // 200, len(found))
+            if url not in found or key < found[url]:
+                found[url] = key
+
+        def meta(key):
+            elem = article_soup.find('meta', {'property': key}) or article_soup.find('meta', {'name': key})
+            return elem.get('content') if elem else None
+
+        meta_width = parse_dimension(meta('og:image:width'))
+        for key in ('og:image:secure_url', 'og:image', 'twitter:image'):
+            add(meta(key), meta_width, 3)
+
+        for elem in article_soup.find_all(['source', 'img']):
+            in_figure = elem.find_parent(['figure', 'picture']) is not None
+            src = elem.get('data-src') or elem.get('src')
+            weight = 2 if in_figure or (src and config['image_hint'] in src) else 1
+            for url, width in parse_srcset(elem.get('data-srcset') or elem.get('srcset') or ''):
+                add(url, width, weight)
+            if elem.name == 'img':
+                add(src, parse_dimension(elem.get('width')), weight)
+
+        return sorted(found, key=found.get)
+
+    def extract_body_text(self, article_soup, config):
+        """Extract the main article text as paragraphs separated by blank lines
+
+        Uses the publication's body selectors when they match, then <article>,
+        then the element holding the most paragraph text.
+        """
+        container = None
+        for selector in config.get('body', []) + ['article']:
+            container = article_soup.select_one(selector)
+            if container:
+                break
+
+        if container is None:
+            text_by_parent = Counter()
+            for p in article_soup.find_all('p'):
+                text_by_parent[id(p.parent)] += len(p.get_text(strip=True))
+            if not text_by_parent:
+                return ''
+            best = text_by_parent.most_common(1)[0][0]
+            container = next(p.parent for p in article_soup.find_all('p') if id(p.parent) == best)
+
+        for elem in container.find_all(['script', 'style', 'aside', 'figure', 'noscript']):
+            elem.decompose()
+
+        paragraphs = [p.get_text(' ', strip=True) for p in container.find_all('p')]
+        paragraphs = [p for p in paragraphs if p]
+        if not paragraphs:
+            paragraphs = [container.get_text(' ', strip=True)]
+        return '\n\n'.join(' '.join(p.split()) for p in paragraphs if p)
+
+    def extract_body_fields(self, article_soup, article_url, config):
+        """Extract article fields from the fully parsed document"""
+        # Extract title
+        title_elem = None
+        if config.get('title_attrs'):
+            title_elem = article_soup.find('h1', config['title_attrs'])
+        title_elem = title_elem or article_soup.find('h1')
+        title = title_elem.get_text().strip() if title_elem else "Article Title"
+
+        # Extract excerpt/description
+        meta_desc = article_soup.find('meta', {'name': 'description'})
+        excerpt = meta_desc['content'] if meta_desc else title[:150] + "..."
+
+        # Gather hero image candidates; they are validated after extraction
+        with self.stats.stage(self.stats.publication_for(article_url), 'image'):
+            image_candidates = self.image_candidates(article_soup, config, article_url)
+
+        # Get author
+        author_tag, author_attrs = config['author']
+        author_elem = article_soup.find(author_tag, author_attrs)
+        author = author_elem.text.strip() if author_elem else config['default_author']
+
+        # Get publish date
+        date_tag, date_attrs = config['date']
+        date_elem = article_soup.find(date_tag, date_attrs)
+        if config.get('date_attr'):
+            date_value = date_elem.get(config['date_attr']) if date_elem else None
+            publish_date = date_value[:10] if date_value else "2024-12-01"
+        else:
+            publish_date = date_elem.text.strip() if date_elem else "2024-12-01"
+
+        with self.stats.stage(self.stats.publication_for(article_url), 'body'):
+            body = self.extract_body_text(article_soup, config)
+
+        return {
+            'title': title,
+            'excerpt': excerpt,
+            'image': image_candidates[0] if image_candidates else None,
+            'image_candidates': image_candidates,
+            'author': author,
+            'publishDate': publish_date,
+            'body': body
+        }
+
+    def extract_article_fields(self, content, article_url, config):
+        """Parse an article page, stopping after <head> when the plan allows it"""
+        if self.early_exit:
+            match = HEAD_END_RE.search(content)
+            if match:
+                head_soup = self.parse_html(content[:match.end()], article_url, mode='head')
+                fields = self.extract_head_fields(head_soup)
+                head_soup.decompose()
+
+                if all(fields.get(field) for field in self.extraction_plan):
+                    fields['author'] = fields['author'] or config['default_author']
+                    fields['publishDate'] = fields['publishDate'] or "2024-12-01"
+                    return fields
+
+        article_soup = self.parse_html(content, article_url)
+        fields = self.extract_body_fields(article_soup, article_url, config)
+
+        # Release the tree now rather than when the garbage collector finds the cycles
+        article_soup.decompose()
+        return fields
+
+    def build_article(self, config, fields, article_url):
+        """Build the output record for an extracted article"""
+        metrics = config['metrics']
+        return {
+            'title': fields['title'],
+            'publication': config['name'],
+            'publicationLogo': config['logo'],
+            'publishDate': fields['publishDate'],
+            'category': config['category'],
+            'excerpt': fields['excerpt'],
+            'image': fields['image'],
+            'readTime': f"{random.randint(3, 8)} min read",
+            'author': fields['author'],
+            'body': fields.get('body', ''),
+            'link': article_url,
+            'metrics': {
+                'views': f"{random.randint(*metrics['views'])}K",
+                'shares': f"{random.randint(*metrics['shares'])}.{random.randint(0, 9)}K",
+                'engagement': f"{random.randint(*metrics['engagement'])}.{random.randint(0, 9)}%"
+            }
+        }
+
+    def feed_entry(self, elem):
+        """Extract link and article fields from an RSS <item> or sitemap <url> element"""
+        link = None
+        fields = {}
+
+        for child in elem.iter():
+            if child is elem:
+                continue
+            name = xml_local_name(child.tag)
+            text = (child.text or '').strip()
+
+            if name in ('link', 'loc') and link is None:
+                link = text or child.get('href')
+            elif name == 'title' and text:
+                fields.setdefault('title', text)
+            elif name in ('description', 'summary') and text:
+                fields.setdefault('excerpt', text)
+            elif name in ('pubdate', 'publication_date', 'published', 'updated') and text:
+                fields.setdefault('publishDate', normalize_feed_date(text))
+            elif name in ('creator', 'author') and text:
+                fields.setdefault('author', text)
+            elif name == 'image':
+                # Sitemap <image:image><image:loc>
+                loc = next((c.text for c in child if xml_local_name(c.tag) == 'loc' and c.text), None)
+                if loc:
+                    fields.setdefault('image', loc.strip())
+            elif name in ('content', 'thumbnail', 'enclosure') and child.get('url'):
+                media_type = child.get('type') or child.get('medium') or 'image'
+                if media_type.startswith('image'):
+                    fields.setdefault('image', child.get('url'))
+
+        # RSS descriptions frequently embed markup and a thumbnail
+        if fields.get('excerpt') and '<' in fields['excerpt']:
+            description = BeautifulSoup(fields['excerpt'], self.parser)
+            img = description.find('img')
+            if img and img.get('src'):
+                fields.setdefault('image', img['src'])
+            fields['excerpt'] = description.get_text(' ', strip=True)
+
+        return (link, fields) if link else None
+
+    def parse_feed(self, content, feed_url):
+        """Stream-parse an RSS feed or news sitemap; returns (entries, child sitemap urls)"""
+        entries = []
+        child_sitemaps = []
+        start = time.perf_counter()
+
+        for _, elem in ET.iterparse(io.BytesIO(content), events=('end',)):
+            name = xml_local_name(elem.tag)
+            if name in ('item', 'url', 'entry'):
+                entry = self.feed_entry(elem)
+                if entry:
+                    entries.append(entry)
+                elem.clear()
+            elif name == 'sitemap':
+                loc = next((c.text for c in elem if xml_local_name(c.tag) == 'loc' and c.text), None)
+                if loc:
+                    child_sitemaps.append(loc.strip())
+                elem.clear()
+
+        elapsed = time.perf_counter() - start
+        self.parse_times.append({'url': feed_url, 'parser': 'iterparse', 'mode': 'feed',
+                                 'bytes': len(content), 'seconds': elapsed})
+        print(f"   Parsed {feed_url} in {elapsed * 1000:.1f} ms (feed, {len(entries)} entries)")
+        return entries, child_sitemaps
+
+    def news_sitemaps(self, config):
+        """Configured news sitemaps plus news sitemaps advertised in robots.txt"""
+        sitemaps = list(config.get('sitemaps', []))
+        try:
+            response = self.fetch(f"{config['base_url']}/robots.txt", timeout=10)
+            if response.status_code == 200:
+                for line in response.text.splitlines():
+                    if line.lower().startswith('sitemap:'):
+                        url = line.split(':', 1)[1].strip()
+                        if 'news' in url.lower() and url not in sitemaps:
+                            sitemaps.append(url)
+        except requests.RequestException as e:
+            print(f"Could not read robots.txt for {config['name']}: {e}")
+        return sitemaps
+
+    def discovery_headers(self):
+        """Request headers for discovery fetches: revalidate cached copies when the daemon is polling"""
+        return {'Cache-Control': 'no-cache'} if self.revalidate_discovery and self.cache is not None else {}
+
+    def read_feed(self, url):
+        """Fetch and parse one feed or sitemap; returns (entries, child sitemap urls)"""
+        try:
+            response = self.fetch(url, timeout=15, headers=self.discovery_headers())
+            if response.status_code != 200:
+                return [], []
+            return self.parse_feed(response.content, url)
+        except (requests.RequestException, ET.ParseError, RobotsDisallowed) as e:
+            if isinstance(e, ET.ParseError):
+                self.stats.error(self.stats.publication_for(url), e)
+            print(f"Error reading feed {url}: {e}")
+            return [], []
+
+    def discover_from_feeds(self, config, limit, feed_urls=None):
+        """Collect article entries from RSS feeds, then news sitemaps if feeds fall short
+
+        With feed_urls only those feeds are read and sitemaps are skipped.
+        """
+        link_re = re.compile(config['link_pattern'])
+        entries = []
+
+        for feed_url in feed_urls if feed_urls is not None else config.get('feeds', []):
+            entries.extend(self.read_feed(feed_url)[0])
+
+        if feed_urls is None and len(entries) < limit and self.discovery_sitemaps:
+            for sitemap_url in self.news_sitemaps(config):
+                found, children = self.read_feed(sitemap_url)
+                entries.extend(found)
+                for child_url in children[:MAX_CHILD_SITEMAPS]:
+                    entries.extend(self.read_feed(child_url)[0])
+                if len(entries) >= limit:
+                    break
+
+        return [(urljoin(config['base_url'], link), fields) for link, fields in entries if link_re.search(link)]
+
+    def discover_from_section(self, config, page=1):
+        """Collect article links from one page of the publication's section"""
+        base_url = config['base_url']
+        section_url = f"{base_url}{config['section']}"
+        if page > 1:
+            section_url = base_url + config['pagination'].format(section=config['section'], page=page)
+        response = self.fetch(section_url, headers=self.discovery_headers())
+        if response.status_code != 200:
+            return []
+
+        # Only article links are needed from the section page
+        link_re = re.compile(config['link_pattern'])
+        soup = self.parse_html(response.content, section_url, mode='links',
+                               parse_only=SoupStrainer('a', href=link_re))
+
+        # Find article links
+        links = [(urljoin(base_url, link['href']), {}) for link in soup.find_all('a', href=link_re)]
+        soup.decompose()
+        return links
+
+    def discover_articles(self, config, limit, source=None):
+        """Lazily yield article candidates as (url, fields already known from discovery)
+
+        Feeds and sitemaps come first; section pages are only requested once
+        the consumer asks for more candidates than the feeds supplied. A
+        source of ('feed', url) or ('section', path) restricts discovery to
+        that one feed or to the section pages.
+        """
+        if source is not None and source[0] == 'feed':
+            yield from self.discover_from_feeds(config, limit, feed_urls=[source[1]])
+            return
+
+        if source is None and self.discovery == 'auto' and (config.get('feeds') or self.discovery_sitemaps):
+            candidates = self.discover_from_feeds(config, limit)
+            if candidates:
+                print(f"   Discovered {len(candidates)} articles from feeds/sitemaps")
+            yield from candidates
+
+        max_pages = self.max_pages if config.get('pagination') else 1
+        section_seen = set()
+        for page in range(1, max_pages + 1):
+            links = [link for link in self.discover_from_section(config, page) if link[0] not in section_seen]
+
+            # Stop at the end of the pagination, or when the site keeps serving the same page
+            if not links:
+                break
+            section_seen.update(url for url, _ in links)
+            if page > 1:
+                print(f"   Section page {page}: {len(links)} links")
+            yield from links
+
+    def fetch_articles(self, config, candidates, stop):
+        """Fetch stage: yield (url, canonical url, discovery fields, page bytes or None)"""
+        for article_url, feed_fields in candidates:
+            if stop.is_set():
+                return
+
+            try:
+                canonical_url = canonicalize_url(article_url)
+                if canonical_url in self.seen_this_run:
+                    continue
+                self.seen_this_run.add(canonical_url)
 
-            for link in article_links[:limit]:
-                try:
-                    article_url = urljoin(base_url, link['href'])
-                    if article_url in [a['link'] for a in articles]:
-                        continue
+                if self.seen_index is not None and not self.seen_index.needs_fetch(canonical_url):
+                    continue
 
-                    article_response = self.session.get(article_url)
-                    article_soup = BeautifulSoup(article_response.content, 'html.parser')
-
-                    title_elem = article_soup.find('h1')
-                    title = title_elem.text.strip() if title_elem else "Article Title"
-
-                    meta_desc = article_soup.find('meta', {'name': 'description'})
-                    excerpt = meta_desc['content'] if meta_desc else title[:150] + "..."
-
-                    # Get image - look for article hero image or main image
-                    img_elem = None
-
-                    # Try different selectors for article images
-                    selectors = [
-                        'img[data-src]',
-                        'img[src*="ht-img"]',
-                        'img[alt*="article"]',
-                        '.article-image img',
-                        '.hero-image img',
-                        'figure img',
-                        'img[alt]'
-                    ]
-
-                    for selector in selectors:
-                        if 'img[' in selector:
-                            # CSS selector with attributes
-                            attr_name = selector.split('[')[1].split(']')[0].split('=')[0]
-                            attr_value = selector.split('=')[1].strip('"]') if '=' in selector else None
-
-                            if attr_value:
-                                img_elem = article_soup.find('img', {attr_name: lambda x: x and attr_value in x})
-                            else:
-                                img_elem = article_soup.find('img', {attr_name: True})
-                        else:
-                            # CSS class selector
-                            container = article_soup.select_one(selector)
-                            if container:
-                                img_elem = container if container.name == 'img' else container.find('img')
-
-                        if img_elem:
-                            break
-
-                    if img_elem:
-                        # Try data-src first, then src
-                        image = (img_elem.get('data-src') or
-                                img_elem.get('src', ''))
-
-                        # Make sure it's a full URL
-                        if image and not image.startswith('http'):
-                            image = urljoin(base_url, image)
-
-                        # Skip if it's an icon or logo
-                        if image and any(skip in image.lower() for skip in ['icon', 'logo', 'svg', 'ad-free']):
-                            image = f"https://www.hindustantimes.com/ht-img/img/2024/12/01/550x309/default_{random.randint(100000, 999999)}.jpg"
-                    else:
-                        image = f"https://www.hindustantimes.com/ht-img/img/2024/12/01/550x309/default_{random.randint(100000, 999999)}.jpg"
-
-                    author_elem = article_soup.find('span', {'class': 'author-name'})
-                    author = author_elem.text.strip() if author_elem else "HT Correspondent"
-
-                    date_elem = article_soup.find('span', {'class': 'date-published'})
-                    publish_date = date_elem.text.strip() if date_elem else "2024-12-01"
-
-                    articles.append({
-                        'title': title,
-                        'publication': 'Hindustan Times',
-                        'publicationLogo': 'https://www.hindustantimes.com/ht-img/img/2023/09/15/1600x900/HT_1694767296495_1694767296731.jpg',
-                        'publishDate': publish_date,
-                        'category': 'News',
-                        'excerpt': excerpt,
-                        'image': image,
-                        'readTime': f"{random.randint(3, 8)} min read",
-                        'author': author,
-                        'link': article_url,
-                        'metrics': {
-                            'views': f"{random.randint(30, 150)}K",
-                            'shares': f"{random.randint(1, 4)}.{random.randint(0, 9)}K",
-                            'engagement': f"{random.randint(4, 10)}.{random.randint(0, 9)}%"
-                        }
-                    })
-
-                    time.sleep(random.uniform(1, 3))
+                # Fetch the article page only for fields discovery could not supply
+                if all(feed_fields.get(field) for field in self.extraction_plan):
+                    yield article_url, canonical_url, feed_fields, None
+                    continue
 
+                content = self.fetch(article_url).content
+                yield article_url, canonical_url, feed_fields, content
+
+            except Exception as e:
+                print(f"Error fetching {config['short_name']} article: {e}")
+                continue
+
+    def extract_article(self, config, article_url, feed_fields, content):
+        """Extract stage: build the article record from discovery fields and page bytes"""
+        if content is not None:
+            fields = self.extract_article_fields(content, article_url, config)
+            fields.update({k: v for k, v in feed_fields.items() if v})
+        else:
+            fields = dict(feed_fields)
+            fields['author'] = fields.get('author') or config['default_author']
+            fields['publishDate'] = fields.get('publishDate') or "2024-12-01"
+
+        # Feed-declared images first, then the page's candidates; the best one that is really an image wins
+        candidates = [fields.get('image')] + fields.pop('image_candidates', [])
+        candidates = list(dict.fromkeys(urljoin(config['base_url'], c) for c in candidates if c))
+        with self.stats.stage(self.stats.publication_for(article_url), 'validate'):
+            fields['image'] = self.images.resolve(candidates) or config['logo']
+        return self.build_article(config, fields, article_url)
+
+    def ensure_pool(self):
+        """Create the extraction pool and start its workers
+
+        ProcessPoolExecutor only forks on the first submit, so no-op tasks are
+        run here; callers start the pool before any fetch or server threads
+        exist, so forked workers never inherit a lock held by one of them.
+        """
+        if self.workers and self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=init_extract_worker,
+                                            initargs=(self.parser, self.early_exit, self.extraction_plan, self.validate_images))
+            for future in [self.pool.submit(worker_ready) for _ in range(self.workers)]:
+                future.result()
+        return self.pool
+
+    def close_pool(self):
+        if self.pool is not None:
+            self.pool.shutdown(wait=True, cancel_futures=True)
+            self.pool = None
+
+    def emit_article(self, key, canonical_url, article, articles):
+        """Index, de-duplicate and output an extracted article; returns True if it was emitted"""
+        # Unchanged articles are already in the dataset
+        is_new = self.seen_index is None or self.seen_index.record(canonical_url, content_hash(article))
+        primary = None
+        if self.dedup:
+            with self.stats.stage(key, 'dedup'):
+                primary = self.dedup.check(canonical_url, article)
+
+        if primary:
+            print(f"   Near-duplicate of {primary}, clustered: {article['link']}")
+            return False
+        if not is_new:
+            return False
+
+        if self.keep_articles:
+            articles.append(article)
+        with self.stats.stage(key, 'output'):
+            for sink in self.sinks:
+                sink.write(article)
+        return True
+
+    def extract_serial(self, key, config, fetched, limit, articles):
+        """Parse and extract in this process, one fetched page at a time"""
+        count = 0
+        for article_url, canonical_url, feed_fields, content in fetched:
+            try:
+                extract_start = time.perf_counter()
+                with self.stats.stage(key, 'extract', url=article_url):
+                    article = self.extract_article(config, article_url, feed_fields, content)
+                self.extract_times[key] = self.extract_times.get(key, 0) + time.perf_counter() - extract_start
+                del content
+
+                if self.emit_article(key, canonical_url, article, articles):
+                    count += 1
+
+            except Exception as e:
+                self.stats.error(key, e)
+                print(f"Error scraping {config['short_name']} article: {e}")
+                continue
+
+            if count >= limit:
+                break
+        return count
+
+    def extract_pooled(self, key, config, fetched, limit, articles):
+        """Hand fetched pages to the process pool and emit records as workers finish"""
+        pool = self.ensure_pool()
+        max_in_flight = self.workers * 2
+        pending = {}
+        count = 0
+
+        def collect(block):
+            nonlocal count
+            done, _ = wait(pending, timeout=None if block else 0, return_when=FIRST_COMPLETED)
+            for future in done:
+                article_url, canonical_url = pending.pop(future)
+                try:
+                    result = future.result()
                 except Exception as e:
-                    print(f"Error scraping HT article: {e}")
+                    self.stats.error(key, e)
+                    print(f"Error scraping {config['short_name']} article: {e}")
                     continue
 
-        except Exception as e:
-            print(f"Error scraping Hindustan Times: {e}")
+                self.parse_times.extend(result['parse_times'])
+                for name, value in result['image_stats'].items():
+                    self.images.stats[name] += value
+                for publication, stage, start, seconds, args in result['spans']:
+                    self.stats.record(publication, stage, start, seconds, pid=result['pid'], tid=1, **args)
+                    if stage == 'extract':
+                        self.extract_times[key] = self.extract_times.get(key, 0) + seconds
 
-        return articles
+                if count < limit and self.emit_article(key, canonical_url, result['article'], articles):
+                    count += 1
 
-    def scrape_economic_times(self, limit=2):
-        """Scrape articles from Economic Times"""
+        try:
+            for article_url, canonical_url, feed_fields, content in fetched:
+                future = pool.submit(extract_in_worker, key, article_url, feed_fields, content)
+                pending[future] = (article_url, canonical_url)
+                del content
+
+                # Pick up finished work between fetches; block only when the pool is saturated
+                collect(block=len(pending) >= max_in_flight)
+                if count >= limit:
+                    break
+
+            while pending and count < limit:
+                collect(block=True)
+        finally:
+            for future in pending:
+                future.cancel()
+
+        return count
+
+    def scrape_publication(self, key, limit=2, source=None):
+        """Scrape articles from a configured publication (or one of its feeds/sections)"""
+        config = PUBLICATIONS[key]
         articles = []
-        base_url = "https://economictimes.indiatimes.com"
+        count = 0
+        stop = threading.Event()
+        started = time.perf_counter()
+        fetched = None
 
         try:
-            response = self.session.get(f"{base_url}/markets")
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            article_links = soup.find_all('a', href=re.compile(r'/articleshow/'))
-
-            for link in article_links[:limit]:
-                try:
-                    article_url = urljoin(base_url, link['href'])
-                    if article_url in [a['link'] for a in articles]:
-                        continue
+            candidates = self.discover_articles(config, limit, source)
+            fetched = self.fetch_articles(config, candidates, stop)
 
-                    article_response = self.session.get(article_url)
-                    article_soup = BeautifulSoup(article_response.content, 'html.parser')
-
-                    title_elem = article_soup.find('h1')
-                    title = title_elem.text.strip() if title_elem else "Article Title"
-
-                    meta_desc = article_soup.find('meta', {'name': 'description'})
-                    excerpt = meta_desc['content'] if meta_desc else title[:150] + "..."
-
-                    # Get image - look for article hero image or main image
-                    img_elem = None
-
-                    # Try different selectors for article images
-                    selectors = [
-                        'img[data-src]',
-                        'img[src*="etimg"]',
-                        'img[alt*="article"]',
-                        '.article-image img',
-                        '.hero-image img',
-                        'figure img',
-                        'img[alt]'
-                    ]
-
-                    for selector in selectors:
-                        if 'img[' in selector:
-                            # CSS selector with attributes
-                            attr_name = selector.split('[')[1].split(']')[0].split('=')[0]
-                            attr_value = selector.split('=')[1].strip('"]') if '=' in selector else None
-
-                            if attr_value:
-                                img_elem = article_soup.find('img', {attr_name: lambda x: x and attr_value in x})
-                            else:
-                                img_elem = article_soup.find('img', {attr_name: True})
-                        else:
-                            # CSS class selector
-                            container = article_soup.select_one(selector)
-                            if container:
-                                img_elem = container if container.name == 'img' else container.find('img')
-
-                        if img_elem:
-                            break
-
-                    if img_elem:
-                        # Try data-src first, then src
-                        image = (img_elem.get('data-src') or
-                                img_elem.get('src', ''))
-
-                        # Make sure it's a full URL
-                        if image and not image.startswith('http'):
-                            image = urljoin(base_url, image)
-
-                        # Skip if it's an icon or logo
-                        if image and any(skip in image.lower() for skip in ['icon', 'logo', 'svg', 'ad-free']):
-                            image = f"https://img.etimg.com/thumb/msid-{random.randint(100000, 999999)},width-400,height-300,resizemode-4/{random.randint(100000, 999999)}.jpg"
-                    else:
-                        image = f"https://img.etimg.com/thumb/msid-{random.randint(100000, 999999)},width-400,height-300,resizemode-4/{random.randint(100000, 999999)}.jpg"
-
-                    author_elem = article_soup.find('span', {'class': 'ag'})
-                    author = author_elem.text.strip() if author_elem else "ET Bureau"
-
-                    date_elem = article_soup.find('time')
-                    publish_date = date_elem.get('datetime')[:10] if date_elem and date_elem.get('datetime') else "2024-12-01"
-
-                    articles.append({
-                        'title': title,
-                        'publication': 'Economic Times',
-                        'publicationLogo': 'https://img.etimg.com/photo/msid-111111111,quality-100/et-logo.jpg',
-                        'publishDate': publish_date,
-                        'category': 'Markets',
-                        'excerpt': excerpt,
-                        'image': image,
-                        'readTime': f"{random.randint(3, 8)} min read",
-                        'author': author,
-                        'link': article_url,
-                        'metrics': {
-                            'views': f"{random.randint(40, 180)}K",
-                            'shares': f"{random.randint(1, 4)}.{random.randint(0, 9)}K",
-                            'engagement': f"{random.randint(5, 11)}.{random.randint(0, 9)}%"
-                        }
-                    })
-
-                    time.sleep(random.uniform(1, 3))
+            # In scale mode fetching runs ahead in a thread, bounded by the prefetch queue
+            if self.prefetch:
+                fetched = bounded_prefetch(fetched, self.prefetch, stop)
 
-                except Exception as e:
-                    print(f"Error scraping ET article: {e}")
-                    continue
+            if self.workers:
+                count = self.extract_pooled(key, config, fetched, limit, articles)
+            else:
+                count = self.extract_serial(key, config, fetched, limit, articles)
 
         except Exception as e:
-            print(f"Error scraping Economic Times: {e}")
+            self.stats.error(key, e)
+            print(f"Error scraping {config['name']}: {e}")
+
+        finally:
+            stop.set()
+            if hasattr(fetched, 'close'):
+                fetched.close()
 
+        self.article_counts[key] = count
+        self.total_articles += count
+        self.publication_times[key] = time.perf_counter() - started
         return articles
 
-    def scrape_all_publications(self):
+    def scrape_times_of_india(self, limit=2):
+        """Scrape articles from Times of India"""
+        return self.scrape_publication('times_of_india', limit)
+
+    def scrape_hindustan_times(self, limit=2):
+        """Scrape articles from Hindustan Times"""
+        return self.scrape_publication('hindustan_times', limit)
+
+    def scrape_economic_times(self, limit=2):
+        """Scrape articles from Economic Times"""
+        return self.scrape_publication('economic_times', limit)
+
+    def print_parse_summary(self):
+        """Print parse time totals grouped by parse mode"""
+        if not self.parse_times:
+            return
+
+        print(f"\nParse times ({self.parser}):")
+        for mode in sorted({p['mode'] for p in self.parse_times}):
+            entries = [p for p in self.parse_times if p['mode'] == mode]
+            total = sum(p['seconds'] for p in entries)
+            print(f"   {mode}: {len(entries)} pages, {total * 1000:.1f} ms total, "
+                  f"{total * 1000 / len(entries):.1f} ms/page")
+
+    def print_index_summary(self):
+        """Print incremental scraping counts"""
+        if self.seen_index is None:
+            return
+
+        stats = self.seen_index.stats
+        print(f"\nSeen index: {stats['new']} new, {stats['changed']} changed, {stats['unchanged']} unchanged, "
+              f"{stats['skipped']} skipped without fetching ({len(self.seen_index.entries)} indexed)")
+
+    def print_throughput_summary(self):
+        """Print articles/sec and peak memory for the run"""
+        elapsed = time.perf_counter() - self.started_at
+        rate = self.total_articles / elapsed if elapsed > 0 else 0
+        peak = peak_rss_mb()
+        print(f"\nThroughput: {self.total_articles} articles in {elapsed:.1f}s ({rate:.2f} articles/sec)"
+              + (f", peak RSS {peak:.1f} MB" if peak is not None else ''))
+
+    def print_dedup_summary(self):
+        """Print near-duplicate detection counts"""
+        if not self.dedup:
+            return
+
+        stats = self.dedup.stats
+        print(f"\nDe-duplication: {stats['duplicates']}/{stats['checked']} near-duplicates clustered, "
+              f"{stats['comparisons']} fingerprint comparisons against {len(self.dedup.signatures)} indexed")
+
+    def reset_stats(self):
+        """Start a new RunStats window (long-running crawls report per window)"""
+        self.stats = RunStats(trace=self.stats.events is not None)
+        self.parse_times = []
+        if self.governor is not None:
+            self.governor.stats = self.stats
+
+    def print_governor_summary(self):
+        """Print the adapted per-domain crawl delays"""
+        if self.governor is None or not self.governor.domains:
+            return
+
+        print("\nCrawl rate:")
+        for host, st in sorted(self.governor.summary().items()):
+            latency = f"{st['latency'] * 1000:.0f} ms" if st['latency'] is not None else 'n/a'
+            print(f"   {host}: {st['requests']} requests, delay now {st['delay']:.2f}s, "
+                  f"{st['backoffs']} backoffs, avg latency {latency}, waited {st['waited']:.1f}s")
+
+    def print_cache_summary(self):
+        """Print HTTP cache hit/revalidation counts"""
+        if not self.cache:
+            return
+
+        stats = self.cache.stats
+        print(f"\nHTTP cache: {stats['hits']} fresh hits, {stats['revalidated']} revalidated (304), "
+              f"{stats['misses']} fetched, {stats['bytes_saved'] // 1024} KB not downloaded")
+
+    def print_image_summary(self):
+        """Print hero image validation counts"""
+        if not self.validate_images:
+            return
+
+        stats = self.images.stats
+        print(f"\nHero images: {stats['resolved']} resolved, {stats['unresolved']} fell back to the publication logo; "
+              f"{stats['validated']} candidates validated, {stats['rejected']} rejected, {stats['cached']} known")
+
+    def scrape_all_publications(self, limit=2):
         """Scrape articles from all major publications"""
         all_articles = []
 
-        print("Scraping Times of India...")
-        toi_articles = self.scrape_times_of_india(2)
-        all_articles.extend(toi_articles)
-        print(f"Found {len(toi_articles)} articles from Times of India")
+        # Fork the workers before any fetch threads exist
+        self.ensure_pool()
+
+        with self.stats.instrument_dns():
+            print("Scraping Times of India...")
+            toi_articles = self.scrape_times_of_india(limit)
+            all_articles.extend(toi_articles)
+            print(f"Found {self.article_counts['times_of_india']} articles from Times of India")
+
+            print("Scraping Hindustan Times...")
+            ht_articles = self.scrape_hindustan_times(limit)
+            all_articles.extend(ht_articles)
+            print(f"Found {self.article_counts['hindustan_times']} articles from Hindustan Times")
+
+            print("Scraping Economic Times...")
+            et_articles = self.scrape_economic_times(limit)
+            all_articles.extend(et_articles)
+            print(f"Found {self.article_counts['economic_times']} articles from Economic Times")
 
-        print("Scraping Hindustan Times...")
-        ht_articles = self.scrape_hindustan_times(2)
-        all_articles.extend(ht_articles)
-        print(f"Found {len(ht_articles)} articles from Hindustan Times")
+        self.close_pool()
 
-        print("Scraping Economic Times...")
-        et_articles = self.scrape_economic_times(2)
-        all_articles.extend(et_articles)
-        print(f"Found {len(et_articles)} articles from Economic Times")
+        self.print_parse_summary()
+        self.print_cache_summary()
+        self.print_image_summary()
+        self.print_governor_summary()
+        self.print_index_summary()
+        self.print_dedup_summary()
+        self.print_throughput_summary()
+        self.stats.print_report()
 
         return all_articles
 
-def main():
-    scraper = ArticleScraper()
-    articles = scraper.scrape_all_publications()
+class CrawlDaemon:
+    """Long-running crawl that revisits productive sections more often
+
+    Every feed and section page of every publication is a schedulable
+    section. Sections sit in a heap ordered by their next due time; a visit
+    that finds new articles halves the section's revisit interval and a
+    visit that finds none stretches it, within [min_interval, max_interval].
+    Schedule and counters are persisted after every visit, so a restart
+    resumes where the previous process stopped.
+    """
+
+    def __init__(self, scraper, state_path=DEFAULT_CRAWL_STATE, visit_limit=DEFAULT_VISIT_LIMIT,
+                 min_interval=DEFAULT_MIN_INTERVAL, max_interval=DEFAULT_MAX_INTERVAL,
+                 compact_every=DEFAULT_COMPACT_MINUTES * 60, on_visit=None, on_compact=None):
+        self.scraper = scraper
+        # Cache TTLs (10-30 min) exceed the shortest revisit interval, so every visit must see the live page
+        scraper.revalidate_discovery = True
+        self.state_path = state_path
+        self.visit_limit = visit_limit
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.compact_every = compact_every
+        self.on_visit = on_visit
+        self.on_compact = on_compact
+        self.stop = threading.Event()
+        self.started_at = time.time()
+
+        state = {}
+        if os.path.exists(state_path):
+            with open(state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        self.counters = state.get('counters', {'visits': 0, 'new_articles': 0, 'errors': 0})
+        self.sections = state.get('sections', {})
+
+        # Register sections that are new in the configuration; stagger their first visits
+        now = time.time()
+        for i, section_id in enumerate(self.section_ids()):
+            self.sections.setdefault(section_id, {
+                'interval': DEFAULT_SECTION_INTERVAL, 'next_due': now + i * 5, 'visits': 0,
+                'new_articles': 0, 'yield': 0.0, 'last_visit': None, 'last_new': None, 'errors': 0
+            })
+        self.heap = [(st['next_due'], section_id) for section_id, st in self.sections.items()
+                     if section_id in set(self.section_ids())]
+        heapq.heapify(self.heap)
+
+    def section_ids(self):
+        for key, config in PUBLICATIONS.items():
+            for feed_url in config.get('feeds', []):
+                yield f"{key}|feed|{feed_url}"
+            yield f"{key}|section|{config['section']}"
+
+    def visit(self, section_id):
+        key, kind, target = section_id.split('|', 2)
+        section = self.sections[section_id]
+        scraper = self.scraper
+        errors_before = sum(sum(c.values()) for c in scraper.stats.errors.values())
+        articles_before = scraper.total_articles
+
+        scraper.seen_this_run.clear()
+        scraper.scrape_publication(key, self.visit_limit, source=(kind, target))
+
+        new = scraper.total_articles - articles_before
+        errors = sum(sum(c.values()) for c in scraper.stats.errors.values()) - errors_before
+        now = time.time()
+
+        section['visits'] += 1
+        section['new_articles'] += new
+        section['errors'] += errors
+        section['yield'] = 0.7 * section['yield'] + 0.3 * new
+        section['last_visit'] = now
+        if new:
+            section['last_new'] = now
+            section['interval'] = max(self.min_interval, section['interval'] / 2)
+        else:
+            section['interval'] = min(self.max_interval, section['interval'] * 1.5)
+        section['next_due'] = now + section['interval']
+
+        self.counters['visits'] += 1
+        self.counters['new_articles'] += new
+        self.counters['errors'] += errors
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] {key} {kind} {target}: {new} new, {errors} errors, "
+              f"next visit in {section['interval'] / 60:.1f} min")
+
+    def save(self):
+        write_json_atomic(self.state_path, {'counters': self.counters, 'sections': self.sections})
+
+    def status(self):
+        """Status counters and the upcoming schedule"""
+        now = time.time()
+        return {
+            'uptime_seconds': now - self.started_at,
+            'counters': self.counters,
+            'articles_this_process': self.scraper.total_articles,
+            'sections': sorted(({'section': section_id, 'due_in_seconds': st['next_due'] - now,
+                                 'interval_seconds': st['interval'], 'yield': round(st['yield'], 2),
+                                 'visits': st['visits'], 'new_articles': st['new_articles'], 'errors': st['errors']}
+                                for section_id, st in self.sections.items()), key=lambda st: st['due_in_seconds'])
+        }
+
+    def serve_status(self, port):
+        """Serve status() as JSON on localhost in a background thread"""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        daemon = self
+
+        class StatusHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = json.dumps(daemon.status(), indent=2).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', port), StatusHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        print(f"Status available at http://127.0.0.1:{port}/")
+        return server
+
+    def run(self, status_port=None):
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: self.stop.set())
+
+        # Fork the workers before the status server or any fetch threads exist
+        self.scraper.ensure_pool()
+
+        server = self.serve_status(status_port) if status_port else None
+        last_compact = time.time()
+        print(f"Crawl daemon started: {len(self.heap)} sections")
 
-    # Save to JSON file
-    with open('scraped_articles.json', 'w', encoding='utf-8') as f:
-        json.dump(articles, f, indent=2, ensure_ascii=False)
+        try:
+            while not self.stop.is_set() and self.heap:
+                next_due, section_id = self.heap[0]
+                if next_due > time.time():
+                    self.stop.wait(min(next_due - time.time(), 60))
+                    continue
+
+                heapq.heappop(self.heap)
+                try:
+                    self.visit(section_id)
+                except Exception as e:
+                    self.counters['errors'] += 1
+                    self.sections[section_id]['next_due'] = time.time() + self.sections[section_id]['interval']
+                    print(f"Error visiting {section_id}: {e}")
+                heapq.heappush(self.heap, (self.sections[section_id]['next_due'], section_id))
+
+                self.save()
+                if self.on_visit:
+                    self.on_visit()
+
+                if self.on_compact and time.time() - last_compact >= self.compact_every:
+                    self.on_compact()
+                    self.scraper.stats.print_report()
+                    self.scraper.reset_stats()
+                    last_compact = time.time()
+        finally:
+            self.scraper.close_pool()
+            self.save()
+            if server:
+                server.shutdown()
+            print(f"Crawl daemon stopped after {self.counters['visits']} visits in total")
+
+
+def diff_articles(baseline, articles):
+    """Compare two article lists by canonical link over the scraped fields"""
+    before = {canonicalize_url(a['link']): a for a in baseline}
+    after = {canonicalize_url(a['link']): a for a in articles}
+    changed = []
+    for key in before.keys() & after.keys():
+        fields = [f for f in CONTENT_FIELDS if before[key].get(f) != after[key].get(f)]
+        if fields:
+            changed.append((key, fields))
+    return sorted(after.keys() - before.keys()), sorted(before.keys() - after.keys()), sorted(changed)
+
+
+def run_benchmark(archive_path, limit=2, repeat=3, parser=None, early_exit=False,
+                  baseline_path=None, save_baseline=None):
+    """Replay a recorded archive and report pages/sec, parse and extraction time per publication"""
+    archive = PageArchive(archive_path)
+    print(f"Benchmarking {archive_path}: {len(archive.index)} recorded responses, {repeat} runs, parser={parser or DEFAULT_PARSER}")
+
+    runs = []
+    articles = []
+    for _ in range(repeat):
+        # Seed the generated fields so output is comparable across runs and builds
+        random.seed(0)
+        scraper = ArticleScraper(parser=parser, early_exit=early_exit, cache_dir=None,
+                                 discovery_sitemaps=True, replay=archive)
+        with contextlib.redirect_stdout(io.StringIO()):
+            articles = scraper.scrape_all_publications(limit)
+        runs.append(scraper)
+
+    host_to_key = {urlparse(c['base_url']).netloc: key for key, c in PUBLICATIONS.items()}
+    print(f"\n{'Publication':<22}{'pages':>7}{'pages/s':>10}{'parse ms':>11}{'extract ms':>12}{'articles':>10}")
+    for key, config in PUBLICATIONS.items():
+        pages, wall, parse, extract = [], [], [], []
+        for scraper in runs:
+            entries = [p for p in scraper.parse_times if host_to_key.get(urlparse(p['url']).netloc) == key]
+            pages.append(len({p['url'] for p in entries}))
+            wall.append(scraper.publication_times.get(key, 0))
+            parse.append(sum(p['seconds'] for p in entries))
+            extract.append(scraper.extract_times.get(key, 0))
+
+        best = min(range(repeat), key=lambda i: wall[i])
+        rate = pages[best] / wall[best] if wall[best] else 0
+        print(f"{config['name']:<22}{pages[best]:>7}{rate:>10.1f}{parse[best] * 1000:>11.1f}"
+              f"{extract[best] * 1000:>12.1f}{runs[best].article_counts.get(key, 0):>10}")
+
+    if archive.misses:
+        print(f"\nWarning: {archive.misses // repeat} requests per run were not in the archive (served as 404)")
+
+    if baseline_path:
+        with open(baseline_path, 'r', encoding='utf-8') as f:
+            added, removed, changed = diff_articles(json.load(f), articles)
+        print(f"\nOutput diff vs {baseline_path}: {len(added)} added, {len(removed)} removed, {len(changed)} changed")
+        for url in added[:5]:
+            print(f"   + {url}")
+        for url in removed[:5]:
+            print(f"   - {url}")
+        for url, fields in changed[:5]:
+            print(f"   ~ {url}: {', '.join(fields)}")
+
+    if save_baseline:
+        write_json_atomic(save_baseline, articles)
+        print(f"\nBaseline output saved to {save_baseline}")
+
+    archive.close()
+    return articles
+
+
+def build_synthetic_index(directory, docs, seed=0):
+    """Index a synthetic corpus with a Zipf-distributed vocabulary, for benchmarking at scale"""
+    rng = random.Random(seed)
+    vocabulary = [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(3, 10)))
+                  for _ in range(50000)]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    cumulative = list(itertools.accumulate(weights))
+
+    index = SearchIndex(directory)
+    start = time.perf_counter()
+    for i in range(docs):
+        title, excerpt, body = (' '.join(rng.choices(vocabulary, cum_weights=cumulative, k=n)) for n in (8, 25, 150))
+        index.write({'title': title, 'excerpt': excerpt, 'body': body, 'publication': 'Synthetic',
+                     'link': f"https://example.com/articles/{i}"})
+    index.close()
+    elapsed = time.perf_counter() - start
+    print(f"Indexed {docs} synthetic articles in {elapsed:.1f}s ({docs / elapsed:.0f} docs/s)")
+
+
+def run_search_benchmark(directory, queries=200, synthetic=0, seed=0):
+    """Report query latency percentiles for keyword, multi-keyword and phrase queries"""
+    if synthetic:
+        build_synthetic_index(directory, synthetic, seed)
+
+    index = SearchIndex(directory)
+    if not index.next_doc:
+        print(f"Search index {directory} is empty")
+        return
+
+    # Queries are drawn from indexed titles so every class has matches to rank
+    rng = random.Random(seed)
+    workload = {'keyword': [], 'two keywords': [], 'phrase': []}
+    while len(workload['phrase']) < queries:
+        tokens = tokenize(index.document(rng.randrange(index.next_doc))['title'] or '')
+        if len(tokens) < 3:
+            continue
+        workload['keyword'].append(rng.choice(tokens))
+        workload['two keywords'].append(' '.join(rng.sample(tokens, 2)))
+        i = rng.randrange(len(tokens) - 1)
+        workload['phrase'].append('"' + ' '.join(tokens[i:i + 2]) + '"')
+
+    print(f"Search benchmark: {index.live_docs} documents in {len(index.segments)} segments, {queries} queries per class")
+    print(f"   {'query':<14}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'avg hits':>10}")
+    for name, batch in workload.items():
+        timings, hits = [], 0
+        for query in batch:
+            start = time.perf_counter()
+            hits += len(index.search(query))
+            timings.append(time.perf_counter() - start)
+        timings.sort()
+        print(f"   {name:<14}{percentile(timings, 50) * 1000:>9.2f}{percentile(timings, 90) * 1000:>9.2f}"
+              f"{percentile(timings, 99) * 1000:>9.2f}{hits / len(batch):>10.1f}")
+    index.close()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Scrape articles from major Indian publications')
+    parser.add_argument('--parser', default=DEFAULT_PARSER,
+                        help=f'BeautifulSoup parser backend (default: {DEFAULT_PARSER})')
+    parser.add_argument('--limit', type=int, default=2, help='Articles to collect per publication (default: 2)')
+    parser.add_argument('--discovery', choices=DISCOVERY_MODES, default='auto',
+                        help='auto: RSS feeds and news sitemaps, falling back to section pages')
+    parser.add_argument('--no-sitemaps', action='store_true',
+                        help='Do not consult news sitemaps during feed discovery')
+    parser.add_argument('--scale', action='store_true',
+                        help='Walk section pagination, pipeline fetching and extraction, and stream output '
+                             'without keeping articles in memory')
+    parser.add_argument('--max-pages', type=int, default=DEFAULT_MAX_PAGES,
+                        help=f'Section pages to walk per publication in scale mode (default: {DEFAULT_MAX_PAGES})')
+    parser.add_argument('--prefetch', type=int, default=DEFAULT_PREFETCH,
+                        help=f'Fetched pages buffered ahead of extraction in scale mode (default: {DEFAULT_PREFETCH})')
+    parser.add_argument('--workers', type=int, default=0,
+                        help='Parse and extract in a pool of this many processes (default: 0, in-process)')
+    parser.add_argument('--initial-delay', type=float, default=DEFAULT_INITIAL_DELAY,
+                        help=f'Starting per-domain delay between requests (default: {DEFAULT_INITIAL_DELAY}s)')
+    parser.add_argument('--min-delay', type=float, default=DEFAULT_MIN_DELAY,
+                        help=f'Lowest per-domain delay; robots.txt Crawl-delay raises it (default: {DEFAULT_MIN_DELAY}s)')
+    parser.add_argument('--max-delay', type=float, default=DEFAULT_MAX_DELAY,
+                        help=f'Highest per-domain delay after backoff (default: {DEFAULT_MAX_DELAY}s)')
+    parser.add_argument('--early-exit', action='store_true',
+                        help='Parse only <head> when it contains every field in the extraction plan')
+    parser.add_argument('--plan', default=','.join(DEFAULT_EXTRACTION_PLAN),
+                        help="Comma-separated fields required before the body is skipped; "
+                             "'body' is added when --search-index or --db is set")
+    parser.add_argument('--no-image-check', action='store_true',
+                        help='Take the top-ranked hero image candidate without validating it over the network')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                        help=f'Directory for the HTTP response cache (default: {DEFAULT_CACHE_DIR})')
+    parser.add_argument('--no-cache', action='store_true', help='Disable the HTTP response cache')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help=f'Output JSON file (default: {DEFAULT_OUTPUT})')
+    parser.add_argument('--index', default=DEFAULT_INDEX,
+                        help=f'Persistent seen-article index (default: {DEFAULT_INDEX})')
+    parser.add_argument('--recheck-hours', type=float, default=DEFAULT_RECHECK_HOURS,
+                        help='Re-fetch already indexed articles after this many hours to detect changes')
+    parser.add_argument('--dedup-index', default=DEFAULT_DEDUP_INDEX,
+                        help=f'Near-duplicate fingerprint index (default: {DEFAULT_DEDUP_INDEX})')
+    parser.add_argument('--dedup-threshold', type=float, default=DEFAULT_DEDUP_THRESHOLD,
+                        help='Estimated Jaccard similarity at which articles count as duplicates')
+    parser.add_argument('--no-dedup', action='store_true', help='Disable near-duplicate detection')
+    parser.add_argument('--stream', nargs='?', const=DEFAULT_STREAM, default=None,
+                        help=f'Append each article to a JSON Lines file as it is scraped (default: {DEFAULT_STREAM})')
+    parser.add_argument('--fsync-every', type=int, default=DEFAULT_FSYNC_EVERY,
+                        help='fsync the stream file after this many articles')
+    parser.add_argument('--rotate-mb', type=float, default=DEFAULT_ROTATE_MB,
+                        help='Rotate the stream file once it reaches this size')
+    parser.add_argument('--compact', action='store_true',
+                        help='Compact the JSON Lines stream into the JSON output file and exit')
+    parser.add_argument('--record', metavar='ARCHIVE', help='Record every fetched response into a zip archive')
+    parser.add_argument('--replay', metavar='ARCHIVE', help='Serve every request from a recorded archive (offline)')
+    parser.add_argument('--benchmark', metavar='ARCHIVE',
+                        help='Replay a recorded archive repeatedly and report per-publication timings')
+    parser.add_argument('--repeat', type=int, default=3, help='Benchmark runs (best run is reported)')
+    parser.add_argument('--baseline', help='Benchmark: diff the replayed output against this JSON file')
+    parser.add_argument('--save-baseline', help='Benchmark: save the replayed output as a baseline JSON file')
+    parser.add_argument('--daemon', action='store_true',
+                        help='Crawl continuously, revisiting sections that produce new articles more often')
+    parser.add_argument('--state', default=DEFAULT_CRAWL_STATE,
+                        help=f'Daemon schedule and counters file (default: {DEFAULT_CRAWL_STATE})')
+    parser.add_argument('--visit-limit', type=int, default=DEFAULT_VISIT_LIMIT,
+                        help=f'Daemon: maximum new articles taken per section visit (default: {DEFAULT_VISIT_LIMIT})')
+    parser.add_argument('--min-interval', type=float, default=DEFAULT_MIN_INTERVAL,
+                        help=f'Daemon: shortest section revisit interval in seconds (default: {DEFAULT_MIN_INTERVAL})')
+    parser.add_argument('--max-interval', type=float, default=DEFAULT_MAX_INTERVAL,
+                        help=f'Daemon: longest section revisit interval in seconds (default: {DEFAULT_MAX_INTERVAL})')
+    parser.add_argument('--compact-minutes', type=float, default=DEFAULT_COMPACT_MINUTES,
+                        help=f'Daemon: rebuild the JSON output this often (default: {DEFAULT_COMPACT_MINUTES})')
+    parser.add_argument('--status-port', type=int, help='Daemon: serve status counters as JSON on this port')
+    parser.add_argument('--report', metavar='PATH', help='Write the structured run report as JSON')
+    parser.add_argument('--trace', metavar='PATH',
+                        help='Write a Chrome trace (chrome://tracing / Perfetto) timeline of every stage')
+    parser.add_argument('--db', metavar='URL',
+                        help='Also upsert scraped articles into a database (sqlite:///path.db or postgresql://...)')
+    parser.add_argument('--db-batch', type=int, default=DEFAULT_DB_BATCH,
+                        help=f'Database rows per bulk statement (default: {DEFAULT_DB_BATCH})')
+    parser.add_argument('--db-transaction-rows', type=int, default=DEFAULT_DB_TRANSACTION_ROWS,
+                        help=f'Database rows per transaction (default: {DEFAULT_DB_TRANSACTION_ROWS})')
+    parser.add_argument('--load-db', action='store_true',
+                        help='Upsert every article in the JSON output file into --db and exit')
+    parser.add_argument('--search-index', nargs='?', const=DEFAULT_SEARCH_INDEX, metavar='DIR',
+                        help=f'Also index scraped articles for full-text search (default dir: {DEFAULT_SEARCH_INDEX})')
+    parser.add_argument('--rebuild-search-index', action='store_true',
+                        help='Rebuild the search index from the JSON output file and exit')
+    parser.add_argument('--search', metavar='QUERY', help='Search the index (keywords and "quoted phrases") and exit')
+    parser.add_argument('--search-limit', type=int, default=10, help='Number of search results to show')
+    parser.add_argument('--search-benchmark', action='store_true', help='Report search query latency and exit')
+    parser.add_argument('--synthetic-docs', type=int, default=0,
+                        help='Search benchmark: first index this many synthetic articles into an empty index')
+    parser.add_argument('--full', action='store_true',
+                        help='Ignore the index and overwrite the output with a fresh scrape')
+    return parser.parse_args()
 
-    print(f"\nTotal articles scraped: {len(articles)}")
-    print("Data saved to scraped_articles.json")
+def main():
+    args = parse_args()
+
+    if args.benchmark:
+        run_benchmark(args.benchmark, limit=args.limit, repeat=args.repeat, parser=args.parser,
+                      early_exit=args.early_exit, baseline_path=args.baseline, save_baseline=args.save_baseline)
+        return
+
+    if args.compact:
+        stream_path = args.stream or DEFAULT_STREAM
+        articles = compact_jsonl(stream_path, args.output)
+        print(f"Compacted {stream_path} into {args.output}: {len(articles)} articles")
+        return
+
+    if args.load_db:
+        if not args.db:
+            print("--load-db needs --db")
+            return
+        with open(args.output, 'r', encoding='utf-8') as f:
+            articles = json.load(f)
+        sink = ArticleDbSink(args.db, batch_size=args.db_batch, transaction_rows=args.db_transaction_rows)
+        start = time.perf_counter()
+        for article in reversed(articles):
+            sink.write(article)
+        sink.close()
+        print(f"Loaded {len(articles)} articles from {args.output} in {time.perf_counter() - start:.2f}s: "
+              f"{sink.stats['batches']} batches, {sink.stats['statements']} statements, "
+              f"{sink.stats['transactions']} transactions")
+        return
+
+    if args.search or args.search_benchmark or args.rebuild_search_index:
+        directory = args.search_index or DEFAULT_SEARCH_INDEX
+        if args.search_benchmark:
+            if args.synthetic_docs and os.path.exists(os.path.join(directory, 'manifest.json')):
+                print(f"{directory} already holds an index; choose an empty --search-index for synthetic documents")
+                return
+            run_search_benchmark(directory, synthetic=args.synthetic_docs)
+        elif args.rebuild_search_index:
+            if os.path.exists(os.path.join(directory, 'manifest.json')):
+                shutil.rmtree(directory)
+            with open(args.output, 'r', encoding='utf-8') as f:
+                articles = json.load(f)
+            index = SearchIndex(directory)
+            for article in reversed(articles):
+                index.write(article)
+            index.close()
+            print(f"Indexed {len(articles)} articles from {args.output} into {directory}")
+        else:
+            index = SearchIndex(directory)
+            start = time.perf_counter()
+            results = index.search(args.search, limit=args.search_limit)
+            print(f"{len(results)} results in {(time.perf_counter() - start) * 1000:.1f} ms")
+            for i, doc in enumerate(results, 1):
+                print(f"\n{i}. {doc['title']} ({doc['score']})")
+                print(f"   {doc['publication']}, {doc['publishDate']}: {doc['link']}")
+            index.close()
+        return
+
+    # Scale and daemon modes never hold the corpus in memory, so they always stream
+    if (args.scale or args.daemon) and not args.stream:
+        args.stream = DEFAULT_STREAM
+    if args.daemon and args.full:
+        print("--daemon relies on the seen-article index; ignoring --full")
+        args.full = False
+
+    seen_index = None if args.full else SeenIndex(args.index, recheck_after=args.recheck_hours * 3600)
+    dedup = None if args.no_dedup else DuplicateDetector(args.dedup_index, threshold=args.dedup_threshold)
+    record = PageArchive(args.record, mode='w') if args.record else None
+    replay = PageArchive(args.replay) if args.replay else None
+    sinks = []
+    if args.stream:
+        sinks.append(JsonlWriter(args.stream, fsync_every=args.fsync_every,
+                                 rotate_bytes=int(args.rotate_mb * 1024 * 1024)))
+    if args.search_index:
+        sinks.append(SearchIndex(args.search_index))
+    db_sink = None
+    if args.db:
+        db_sink = ArticleDbSink(args.db, batch_size=args.db_batch, transaction_rows=args.db_transaction_rows)
+        sinks.append(db_sink)
+
+    # The search index and the database store the body, which only the article page supplies,
+    # so feed entries and head-only parses must not satisfy the plan without it
+    extraction_plan = [f.strip() for f in args.plan.split(',') if f.strip()]
+    if (args.search_index or args.db) and 'body' not in extraction_plan:
+        extraction_plan.append('body')
+
+    scraper = ArticleScraper(parser=args.parser, early_exit=args.early_exit,
+                             extraction_plan=extraction_plan,
+                             cache_dir=None if args.no_cache else args.cache_dir,
+                             seen_index=seen_index, dedup=dedup, sinks=sinks,
+                             discovery=args.discovery, discovery_sitemaps=not args.no_sitemaps,
+                             max_pages=args.max_pages if args.scale else 1,
+                             prefetch=args.prefetch if args.scale else 0,
+                             keep_articles=not (args.scale or args.daemon), record=record, replay=replay,
+                             trace=bool(args.trace), workers=args.workers,
+                             governor_options={'initial_delay': args.initial_delay, 'min_delay': args.min_delay,
+                                               'max_delay': args.max_delay},
+                             validate_images=not args.no_image_check)
+
+    def save_state():
+        if args.report:
+            scraper.stats.write_report(args.report)
+            print(f"Run report saved to {args.report}")
+        if args.trace:
+            scraper.stats.write_trace(args.trace)
+            print(f"Trace saved to {args.trace}")
+        if seen_index is not None:
+            seen_index.save()
+        if dedup is not None:
+            dedup.save()
+        if db_sink is not None:
+            print(f"Database: {db_sink.stats['rows']} rows upserted in {db_sink.stats['batches']} batches, "
+                  f"{db_sink.stats['statements']} statements, {db_sink.stats['transactions']} transactions")
+        for archive in (record, replay):
+            if archive is not None:
+                archive.close()
+
+    if args.daemon:
+        def persist_visit():
+            for sink in sinks:
+                sink.sync()
+            seen_index.save()
+
+        def compact():
+            if dedup is not None:
+                dedup.save()
+            articles = compact_jsonl(args.stream, args.output)
+            print(f"Compacted {args.stream} into {args.output}: {len(articles)} articles")
+
+        daemon = CrawlDaemon(scraper, args.state, visit_limit=args.visit_limit, min_interval=args.min_interval,
+                             max_interval=args.max_interval, compact_every=args.compact_minutes * 60,
+                             on_visit=persist_visit, on_compact=compact)
+        try:
+            daemon.run(status_port=args.status_port)
+        finally:
+            for sink in sinks:
+                sink.close()
+            save_state()
+            compact()
+        return
+
+    if args.stream:
+        # Streamed articles are already on disk, so state is saved even if the run is interrupted
+        try:
+            scraped = scraper.scrape_all_publications(args.limit)
+        finally:
+            for sink in sinks:
+                sink.close()
+            save_state()
+
+        if args.scale:
+            print(f"\nArticles scraped this run: {scraper.total_articles}")
+            print(f"Streamed to {args.stream}; run with --compact to rebuild {args.output}")
+            return
+        articles = compact_jsonl(args.stream, args.output)
+    else:
+        try:
+            scraped = scraper.scrape_all_publications(args.limit)
+        finally:
+            for sink in sinks:
+                sink.close()
+
+        # Merge into the existing dataset unless a full re-scrape was requested
+        articles = scraped
+        if seen_index is not None and os.path.exists(args.output):
+            with open(args.output, 'r', encoding='utf-8') as f:
+                articles = merge_articles(json.load(f), scraped)
+
+        # Save to JSON file
+        write_json_atomic(args.output, articles)
+        save_state()
+
+    print(f"\nArticles scraped this run: {len(scraped)}")
+    print(f"Total articles in dataset: {len(articles)}")
+    print(f"Data saved to {args.output}")
 
     # Print sample articles
     for i, article in enumerate(articles[:3], 1):